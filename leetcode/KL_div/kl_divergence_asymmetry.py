@@ -1,6 +1,7 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
 from scipy.stats import norm
+from scipy.special import logsumexp
 from scipy.optimize import minimize
 
 # --- 1. Define the True Bimodal Distribution p(x) ---
@@ -10,40 +11,83 @@ p_mix = 0.4
 p_loc1, p_scale1 = -3, 0.8
 p_loc2, p_scale2 = 3, 1.2
 
-def p_pdf(x):
+# A configuration describes one bimodal p(x); the module constants above are
+# the default one. fit_grid sweeps many of these.
+CONFIG_FIELDS = ('p_mix', 'p_loc1', 'p_scale1', 'p_loc2', 'p_scale2')
+DEFAULT_CONFIG = (p_mix, p_loc1, p_scale1, p_loc2, p_scale2)
+
+def mixture_components(config=DEFAULT_CONFIG):
+    """
+    Weights, locations and scales of p(x) as column arrays, shaped to
+    broadcast against a row of x values.
+    """
+    mix, loc1, scale1, loc2, scale2 = config
+    return (np.array([[mix], [1 - mix]]),
+            np.array([[loc1], [loc2]]),
+            np.array([[scale1], [scale2]]))
+
+def p_logpdf(x, config=DEFAULT_CONFIG):
+    """
+    The log-density of p(x) and its derivative d/dx log p(x), vectorized over x.
+    The mixture is combined in log-space with logsumexp, so far tails do not
+    underflow to log(0) and need no epsilon.
+    """
+    p_weights, p_locs, p_scales = mixture_components(config)
+    x = np.asarray(x, dtype=float)
+    component_logpdf = norm.logpdf(x, loc=p_locs, scale=p_scales)
+    log_p = logsumexp(component_logpdf, axis=0, b=p_weights)
+    # Component responsibilities r_k(x) = w_k N_k(x) / p(x)
+    responsibilities = p_weights * np.exp(component_logpdf - log_p)
+    dlog_p = np.sum(responsibilities * -(x - p_locs) / p_scales**2, axis=0)
+    return log_p, dlog_p
+
+def p_pdf(x, config=DEFAULT_CONFIG):
     """The probability density function (PDF) of our bimodal distribution p(x)."""
-    return p_mix * norm.pdf(x, loc=p_loc1, scale=p_scale1) + \
-           (1 - p_mix) * norm.pdf(x, loc=p_loc2, scale=p_scale2)
+    return np.exp(p_logpdf(x, config)[0])
 
-def sample_from_p(n_samples):
+def sample_from_p(n_samples, config=DEFAULT_CONFIG, random_state=None):
     """Draws samples from the true bimodal distribution p(x)."""
-    n1 = int(n_samples * p_mix)
+    mix, loc1, scale1, loc2, scale2 = config
+    n1 = int(n_samples * mix)
     n2 = n_samples - n1
-    samples1 = norm.rvs(loc=p_loc1, scale=p_scale1, size=n1)
-    samples2 = norm.rvs(loc=p_loc2, scale=p_scale2, size=n2)
+    rng = np.random.default_rng(random_state)
+    samples1 = norm.rvs(loc=loc1, scale=scale1, size=n1, random_state=rng)
+    samples2 = norm.rvs(loc=loc2, scale=scale2, size=n2, random_state=rng)
     return np.concatenate([samples1, samples2])
 
 # --- 2. Define Objective Functions for KL Divergence Minimization ---
 
+# Fixed standard-normal draws (common random numbers): every objective
+# evaluation sees the same noise, so the objective is smooth and reproducible.
+standard_normal_draws = np.random.default_rng(0).standard_normal(2000)
+
 # Objective for minimizing D_KL(q || p) -- "Reverse KL"
 # This is used in variational inference. We need to sample from q.
-def reverse_kl_objective(params):
+def reverse_kl_objective(params, eps=standard_normal_draws, config=DEFAULT_CONFIG):
     """
-    Approximates the KL divergence D_KL(q || p) using Monte Carlo sampling.
+    Approximates the KL divergence D_KL(q || p) with the reparameterization
+    x = mu + sigma * eps, and returns it with its analytic gradient with
+    respect to (mu, log_sigma).
     We minimize E_q[log q(x) - log p(x)].
     """
     mu_q, log_sigma_q = params
     sigma_q = np.exp(log_sigma_q)  # Ensure sigma is positive
 
-    # 1. Sample from the approximating distribution q(z)
-    samples_from_q = norm.rvs(loc=mu_q, scale=sigma_q, size=2000)
+    # 1. Reparameterized samples from the approximating distribution q(z)
+    samples_from_q = mu_q + sigma_q * eps
 
-    # 2. Calculate the terms of the expectation
-    log_q = norm.logpdf(samples_from_q, loc=mu_q, scale=sigma_q)
-    log_p = np.log(p_pdf(samples_from_q) + 1e-10) # Add epsilon for stability
+    # 2. Calculate the terms of the expectation. log q(x) only depends on eps
+    # and log_sigma, so d/dmu E[log q] = 0 and d/dlog_sigma E[log q] = -1.
+    log_q = norm.logpdf(eps) - log_sigma_q
+    log_p, dlog_p = p_logpdf(samples_from_q, config)
 
     # We want to minimize KL, so we return the mean of (log_q - log_p)
-    return np.mean(log_q - log_p)
+    kl = np.mean(log_q - log_p)
+    grad = np.array([
+        -np.mean(dlog_p),
+        -1.0 - np.mean(dlog_p * sigma_q * eps),
+    ])
+    return kl, grad
 
 # Objective for minimizing D_KL(p || q) -- "Forward KL"
 # This is equivalent to Maximum Likelihood Estimation. We just need samples from p.
@@ -65,63 +109,111 @@ def forward_kl_objective(params, samples_from_p):
 
 # --- 3. Run the Optimization ---
 
-# Generate a large number of samples from p for the forward KL calculation
-p_samples = sample_from_p(5000)
-
 # Initial guess for the parameters of q (mu, log(sigma))
 initial_guess = [0.0, np.log(2.0)]
 
-# Find optimal q for Reverse KL: D_KL(q || p)
-# This finds a q that avoids placing mass where p is zero.
-print("Optimizing for Reverse KL: D_KL(q || p)... (Mode-Seeking)")
-res_reverse = minimize(
-    reverse_kl_objective,
-    initial_guess,
-    method='L-BFGS-B'
+def fit_reverse_kl(config=DEFAULT_CONFIG):
+    """
+    Find optimal q for Reverse KL: D_KL(q || p).
+    This finds a q that avoids placing mass where p is zero.
+    Returns (mu, sigma).
+    """
+    res_reverse = minimize(
+        reverse_kl_objective,
+        initial_guess,
+        args=(standard_normal_draws, config),
+        jac=True,
+        method='L-BFGS-B'
+    )
+    return res_reverse.x[0], np.exp(res_reverse.x[1])
+
+def fit_forward_kl(config=DEFAULT_CONFIG, n_samples=5000, random_state=0):
+    """
+    Find optimal q for Forward KL: D_KL(p || q).
+    This finds a q that covers all the areas where p has mass.
+    Returns (mu, sigma).
+    """
+    # Generate a large number of samples from p for the forward KL calculation
+    p_samples = sample_from_p(n_samples, config, random_state)
+    res_forward = minimize(
+        forward_kl_objective,
+        initial_guess,
+        args=(p_samples,),
+        method='L-BFGS-B'
+    )
+    return res_forward.x[0], np.exp(res_forward.x[1])
+
+def fit_config(config):
+    """Fit both directions for one configuration; returns one result row."""
+    config = tuple(config)
+    return config + fit_reverse_kl(config) + fit_forward_kl(config)
+
+RESULT_DTYPE = np.dtype(
+    [(field, float) for field in CONFIG_FIELDS]
+    + [('mu_reverse', float), ('sigma_reverse', float),
+       ('mu_forward', float), ('sigma_forward', float)]
 )
-mu_reverse, sigma_reverse = res_reverse.x[0], np.exp(res_reverse.x[1])
-print(f"Result -> mu = {mu_reverse:.2f}, sigma = {sigma_reverse:.2f}\n")
 
+def fit_grid(configs, workers=None, chunksize=16):
+    """
+    Fit forward and reverse KL for every (p_mix, p_loc1, p_scale1, p_loc2,
+    p_scale2) configuration across a pool of `workers` processes.
 
-# Find optimal q for Forward KL: D_KL(p || q)
-# This finds a q that covers all the areas where p has mass.
-print("Optimizing for Forward KL: D_KL(p || q)... (Mass-Covering)")
-res_forward = minimize(
-    lambda params: forward_kl_objective(params, p_samples),
-    initial_guess,
-    method='L-BFGS-B'
-)
-mu_forward, sigma_forward = res_forward.x[0], np.exp(res_forward.x[1])
-print(f"Result -> mu = {mu_forward:.2f}, sigma = {sigma_forward:.2f}")
+    Returns a NumPy record array with one row per configuration, in input order.
+    """
+    configs = [tuple(config) for config in configs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        rows = list(executor.map(fit_config, configs, chunksize=chunksize))
+    return np.rec.fromrecords(rows, dtype=RESULT_DTYPE) if rows \
+        else np.recarray(0, dtype=RESULT_DTYPE)
 
 
 # --- 4. Plot the Results ---
-x_domain = np.linspace(-8, 8, 500)
-q_reverse_pdf = norm.pdf(x_domain, loc=mu_reverse, scale=sigma_reverse)
-q_forward_pdf = norm.pdf(x_domain, loc=mu_forward, scale=sigma_forward)
-
-plt.style.use('seaborn-v0_8-whitegrid')
-fig, ax = plt.subplots(figsize=(12, 7))
-
-# Plot the true distribution p(x)
-ax.plot(x_domain, p_pdf(x_domain), color='black', linestyle='--', linewidth=3, label='True Bimodal p(x)')
-
-# Plot the Reverse KL result
-ax.plot(x_domain, q_reverse_pdf, color='red', linewidth=2, label='Fit via min D_KL(q || p) [Mode-Seeking]')
-
-# Plot the Forward KL result
-ax.plot(x_domain, q_forward_pdf, color='blue', linewidth=2, label='Fit via min D_KL(p || q) [Mass-Covering]')
-
-# Fill areas to show the nature of the fit
-ax.fill_between(x_domain, q_reverse_pdf, color='red', alpha=0.2)
-ax.fill_between(x_domain, q_forward_pdf, color='blue', alpha=0.2)
-
-# Formatting
-ax.set_title('KL Divergence Asymmetry: Approximating a Bimodal Distribution', fontsize=16)
-ax.set_xlabel('x', fontsize=12)
-ax.set_ylabel('Probability Density', fontsize=12)
-ax.legend(fontsize=11)
-ax.set_ylim(0, 0.3)
-ax.set_yticks([]) # Hide y-axis ticks for clarity
-plt.tight_layout()
-plt.show()
+def plot_fits(mu_reverse, sigma_reverse, mu_forward, sigma_forward, config=DEFAULT_CONFIG):
+    import matplotlib.pyplot as plt
+
+    x_domain = np.linspace(-8, 8, 500)
+    q_reverse_pdf = norm.pdf(x_domain, loc=mu_reverse, scale=sigma_reverse)
+    q_forward_pdf = norm.pdf(x_domain, loc=mu_forward, scale=sigma_forward)
+
+    plt.style.use('seaborn-v0_8-whitegrid')
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    # Plot the true distribution p(x)
+    ax.plot(x_domain, p_pdf(x_domain, config), color='black', linestyle='--', linewidth=3, label='True Bimodal p(x)')
+
+    # Plot the Reverse KL result
+    ax.plot(x_domain, q_reverse_pdf, color='red', linewidth=2, label='Fit via min D_KL(q || p) [Mode-Seeking]')
+
+    # Plot the Forward KL result
+    ax.plot(x_domain, q_forward_pdf, color='blue', linewidth=2, label='Fit via min D_KL(p || q) [Mass-Covering]')
+
+    # Fill areas to show the nature of the fit
+    ax.fill_between(x_domain, q_reverse_pdf, color='red', alpha=0.2)
+    ax.fill_between(x_domain, q_forward_pdf, color='blue', alpha=0.2)
+
+    # Formatting
+    ax.set_title('KL Divergence Asymmetry: Approximating a Bimodal Distribution', fontsize=16)
+    ax.set_xlabel('x', fontsize=12)
+    ax.set_ylabel('Probability Density', fontsize=12)
+    ax.legend(fontsize=11)
+    ax.set_ylim(0, 0.3)
+    ax.set_yticks([]) # Hide y-axis ticks for clarity
+    plt.tight_layout()
+    plt.show()
+
+
+def main():
+    print("Optimizing for Reverse KL: D_KL(q || p)... (Mode-Seeking)")
+    mu_reverse, sigma_reverse = fit_reverse_kl()
+    print(f"Result -> mu = {mu_reverse:.2f}, sigma = {sigma_reverse:.2f}\n")
+
+    print("Optimizing for Forward KL: D_KL(p || q)... (Mass-Covering)")
+    mu_forward, sigma_forward = fit_forward_kl()
+    print(f"Result -> mu = {mu_forward:.2f}, sigma = {sigma_forward:.2f}")
+
+    plot_fits(mu_reverse, sigma_reverse, mu_forward, sigma_forward)
+
+
+if __name__ == "__main__":
+    main()
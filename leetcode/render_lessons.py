@@ -0,0 +1,207 @@
+"""
+Batch renderer for the manim lesson scenes in `*_lesson.py`.
+
+Every scene is rendered in its own worker process, and manim's
+content-addressed caches in `media/Tex` and `media/texts` (files named by a
+hash of the TeX / text content) are shared: a formula or label rendered by
+one scene is reused by every other scene and every later run.
+
+Workers never write to the shared caches directly, since two scenes
+compiling the same formula would race on one file and could read it half
+written. Each worker gets a private copy of the caches made of hard links
+to the shared files, and after rendering it publishes its new files by
+linking (or renaming) them into place, which is atomic.
+
+A scene is skipped when the hash of its class source, together with the
+render quality, matches the one recorded in `media/render_manifest.json`
+and its video is still on disk.
+
+Usage:
+    python render_lessons.py [--workers N] [--quality low_quality] [--force] [Scene ...]
+"""
+import argparse
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+LESSON_DIR = Path(__file__).resolve().parent
+MEDIA_DIR = LESSON_DIR / "media"
+MANIFEST_PATH = MEDIA_DIR / "render_manifest.json"
+# manim config keys of the shared caches, and their directory under media/
+CACHE_DIRS = {"tex_dir": "Tex", "text_dir": "texts"}
+
+# Subdirectory manim uses for each quality preset under media/videos/<module>/
+QUALITY_DIRS = {
+    "low_quality": "480p15",
+    "medium_quality": "720p30",
+    "high_quality": "1080p60",
+    "production_quality": "1440p60",
+    "fourk_quality": "2160p60",
+}
+
+
+def discover_scenes(lesson_dir=LESSON_DIR):
+    """
+    Find the Scene classes in every lesson file without importing manim.
+
+    Returns a list of (lesson_path, scene_name, source_hash) tuples, where the
+    hash covers the class source (and so its construct method).
+    """
+    scenes = []
+    for path in sorted(lesson_dir.glob("*_lesson.py")):
+        source = path.read_text(encoding="utf-8")
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.ClassDef) and any(
+                isinstance(base, ast.Name) and base.id.endswith("Scene") for base in node.bases
+            ):
+                segment = ast.get_source_segment(source, node)
+                digest = hashlib.sha256(segment.encode("utf-8")).hexdigest()
+                scenes.append((path, node.name, digest))
+    return scenes
+
+
+def video_path(lesson_path, scene_name, quality):
+    return MEDIA_DIR / "videos" / lesson_path.stem / QUALITY_DIRS[quality] / f"{scene_name}.mp4"
+
+
+def load_manifest():
+    if MANIFEST_PATH.exists():
+        return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_manifest(manifest):
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def link_cache(source_dir, target_dir):
+    """
+    Make every file of `source_dir` appear in `target_dir` (hard links, or
+    copies across filesystems) without overwriting files already there.
+
+    A file only ever appears under its final name complete: a hard link is
+    created in one step, and a copy is written to a temporary name first and
+    then renamed.
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    if not source_dir.is_dir():
+        return
+    for source in source_dir.iterdir():
+        target = target_dir / source.name
+        if not source.is_file() or target.exists():
+            continue
+        try:
+            os.link(source, target)
+        except FileExistsError:
+            pass  # another worker published the same file first
+        except OSError:
+            fd, temporary = tempfile.mkstemp(dir=target_dir, prefix=f".{source.name}.")
+            os.close(fd)
+            shutil.copy2(source, temporary)
+            os.replace(temporary, target)
+
+
+def render_scene(lesson_path, scene_name, quality):
+    """
+    Render one scene and publish its new Tex/text cache files; returns seconds taken.
+    Runs in a worker process, so manim is only imported there.
+    """
+    from manim import tempconfig
+
+    start = time.perf_counter()
+    spec = importlib.util.spec_from_file_location(lesson_path.stem, lesson_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    MEDIA_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=MEDIA_DIR, prefix=f".{scene_name}.") as private:
+        private_dirs = {key: Path(private) / name for key, name in CACHE_DIRS.items()}
+        for key, name in CACHE_DIRS.items():
+            link_cache(MEDIA_DIR / name, private_dirs[key])
+
+        with tempconfig({
+            "media_dir": str(MEDIA_DIR),
+            **{key: str(path) for key, path in private_dirs.items()},
+            "quality": quality,
+            "input_file": str(lesson_path),
+            "scene_names": [scene_name],
+            "disable_caching": False,
+        }):
+            getattr(module, scene_name)().render()
+
+        for key, name in CACHE_DIRS.items():
+            link_cache(private_dirs[key], MEDIA_DIR / name)
+    return time.perf_counter() - start
+
+
+def plan_renders(scenes, manifest, quality, force=False, scene_names=None):
+    """
+    Split discovered scenes into those to skip and those to render.
+
+    Returns (skipped, pending): skipped is a list of scene names whose manifest
+    fingerprint matches and whose video exists; pending is a list of
+    (lesson_path, scene_name, key, fingerprint) tuples.
+    """
+    skipped = []
+    pending = []
+    for lesson_path, scene_name, digest in scenes:
+        if scene_names and scene_name not in scene_names:
+            continue
+        key = f"{lesson_path.stem}.{scene_name}"
+        fingerprint = f"{digest}:{quality}"
+        if not force and manifest.get(key) == fingerprint \
+                and video_path(lesson_path, scene_name, quality).exists():
+            skipped.append(scene_name)
+        else:
+            pending.append((lesson_path, scene_name, key, fingerprint))
+    return skipped, pending
+
+
+def render_lessons(scene_names=None, workers=None, quality="low_quality", force=False):
+    """
+    Render the selected lesson scenes (all by default) in parallel processes.
+
+    Returns a dict mapping scene name to its render time in seconds, or None
+    for scenes skipped because they are unchanged.
+    """
+    manifest = load_manifest()
+    skipped, pending = plan_renders(discover_scenes(), manifest, quality, force, scene_names)
+    timings = dict.fromkeys(skipped)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(render_scene, lesson_path, scene_name, quality): (scene_name, key, fingerprint)
+            for lesson_path, scene_name, key, fingerprint in pending
+        }
+        for future in as_completed(futures):
+            scene_name, key, fingerprint = futures[future]
+            timings[scene_name] = future.result()
+            manifest[key] = fingerprint
+            save_manifest(manifest)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the manim lesson scenes.")
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="number of render processes")
+    parser.add_argument("--quality", default="low_quality", choices=sorted(QUALITY_DIRS))
+    parser.add_argument("--force", action="store_true", help="re-render unchanged scenes")
+    args = parser.parse_args()
+
+    timings = render_lessons(args.scenes, args.workers, args.quality, args.force)
+    for scene_name, seconds in sorted(timings.items()):
+        status = "unchanged, skipped" if seconds is None else f"{seconds:.1f}s"
+        print(f"{scene_name:<24} {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import pytest
+from . import render_lessons
+from .render_lessons import discover_scenes, link_cache, plan_renders, video_path
+
+LESSON = '''
+from manim import Scene, MovingCameraScene
+
+
+class Helper:
+    pass
+
+
+class Intro(Scene):
+    def construct(self):
+        self.wait()
+
+
+class Zoom(MovingCameraScene):
+    def construct(self):
+        self.wait(2)
+'''
+
+
+@pytest.fixture
+def lesson_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_lessons, "MEDIA_DIR", tmp_path / "media")
+    (tmp_path / "kl_lesson.py").write_text(LESSON, encoding="utf-8")
+    (tmp_path / "notes.py").write_text("class Ignored(Scene):\n    pass\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_discover_scenes_finds_scene_classes(lesson_dir):
+    scenes = discover_scenes(lesson_dir)
+    assert [(path.name, name) for path, name, _ in scenes] == [("kl_lesson.py", "Intro"), ("kl_lesson.py", "Zoom")]
+
+
+def test_discover_scenes_hash_follows_class_source(lesson_dir):
+    before = {name: digest for _, name, digest in discover_scenes(lesson_dir)}
+    path = lesson_dir / "kl_lesson.py"
+    path.write_text(LESSON.replace("self.wait(2)", "self.wait(3)"), encoding="utf-8")
+    after = {name: digest for _, name, digest in discover_scenes(lesson_dir)}
+
+    assert after["Intro"] == before["Intro"]
+    assert after["Zoom"] != before["Zoom"]
+
+
+def test_plan_renders_skips_unchanged_scenes_with_videos(lesson_dir):
+    scenes = discover_scenes(lesson_dir)
+    manifest = {f"kl_lesson.{name}": f"{digest}:low_quality" for _, name, digest in scenes}
+    intro_path = scenes[0][0]
+
+    # No videos yet: everything renders.
+    skipped, pending = plan_renders(scenes, manifest, "low_quality")
+    assert skipped == []
+    assert [name for _, name, _, _ in pending] == ["Intro", "Zoom"]
+
+    video = video_path(intro_path, "Intro", "low_quality")
+    video.parent.mkdir(parents=True)
+    video.write_bytes(b"")
+    skipped, pending = plan_renders(scenes, manifest, "low_quality")
+    assert skipped == ["Intro"]
+    assert [name for _, name, _, _ in pending] == ["Zoom"]
+
+    # A different quality, --force, or a scene filter change the plan.
+    assert plan_renders(scenes, manifest, "high_quality")[0] == []
+    assert plan_renders(scenes, manifest, "low_quality", force=True)[0] == []
+    skipped, pending = plan_renders(scenes, manifest, "low_quality", scene_names=["Zoom"])
+    assert (skipped, [name for _, name, _, _ in pending]) == ([], ["Zoom"])
+
+
+def test_link_cache_publishes_without_overwriting(tmp_path):
+    private, shared = tmp_path / "private", tmp_path / "shared"
+    private.mkdir()
+    shared.mkdir()
+    (private / "a.svg").write_text("new a")
+    (private / "b.svg").write_text("new b")
+    (shared / "a.svg").write_text("old a")
+
+    link_cache(private, shared)
+
+    assert (shared / "a.svg").read_text() == "old a"
+    assert (shared / "b.svg").read_text() == "new b"
+    assert sorted(path.name for path in shared.iterdir()) == ["a.svg", "b.svg"]
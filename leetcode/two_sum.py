@@ -8,7 +8,8 @@ Input: nums = [2, 7, 11, 15], target = 9
 Output: [0, 1]
 Explanation: Because nums[0] + nums[1] == 9, we return [0, 1].
 """
-from typing import List
+from bisect import bisect_left
+from typing import Dict, Iterable, List
 
 def two_sum(nums: List[int], target: int) -> List[int]:
     seen = {}  # Dictionary to store numbers we've seen and their indices
@@ -20,3 +21,104 @@ def two_sum(nums: List[int], target: int) -> List[int]:
     return []  # Should not be reached given the problem constraints
 
 
+
+
+class TwoSumIndex:
+    """
+    Answer many two-sum queries against the same `nums` without rebuilding state.
+
+    Results match `two_sum`: the pair [j, i] with the smallest possible i, and
+    j the last index before i holding the complement.
+
+    That smallest i is always the first occurrence of some value v whose
+    complement first occurs earlier, except when v is exactly half the target,
+    where it can be v's second occurrence. So a query only has to look at each
+    distinct value once, through a value -> first index table.
+
+    mode="hash" walks the distinct values in order of first occurrence and
+    stops at the first hit, like `two_sum` but skipping repeated values and
+    without building a dict per query. A target with no pair still visits
+    every distinct value, since nothing short of indexing all pair sums can
+    rule it out sooner.
+
+    mode="sorted" keeps the distinct values sorted with NumPy. Their
+    complements are then sorted too, so one vectorised binary search per query
+    finds every value whose complement exists; the answer is the smallest
+    qualifying first index.
+    """
+
+    def __init__(self, nums: List[int], mode: str = "hash"):
+        if mode not in ("hash", "sorted"):
+            raise ValueError(f"unknown mode: {mode!r}")
+        self.mode = mode
+        if mode == "hash":
+            self.nums = list(nums)
+            # Insertion order is first-occurrence order.
+            self.positions: Dict[int, List[int]] = {}
+            for i, num in enumerate(self.nums):
+                self.positions.setdefault(num, []).append(i)
+            self.first = {num: indices[0] for num, indices in self.positions.items()}
+        else:
+            import numpy as np
+
+            self._np = np
+            self.nums = np.asarray(nums)
+            self.order = np.argsort(self.nums, kind="stable")
+            self.sorted_nums = self.nums[self.order]
+            self.values, starts, counts = np.unique(self.sorted_nums, return_index=True, return_counts=True)
+            self.first_indices = self.order[starts]
+            # Second occurrence of each value, or len(nums) when it has none.
+            self.second_indices = np.full(len(self.values), len(self.nums))
+            repeated = counts > 1
+            self.second_indices[repeated] = self.order[starts[repeated] + 1]
+
+    def query(self, target: int) -> List[int]:
+        if self.mode == "hash":
+            return self._query_hash(target)
+        return self._query_sorted(target)
+
+    def query_many(self, targets: Iterable[int]) -> List[List[int]]:
+        return [self.query(target) for target in targets]
+
+    def _query_hash(self, target: int) -> List[int]:
+        first, positions = self.first, self.positions
+        missing = len(self.nums)
+        # A value paired with itself needs its second occurrence.
+        halves = positions.get(target // 2, ()) if target % 2 == 0 else ()
+        best_i = halves[1] if len(halves) > 1 else missing
+        get = first.get
+        for num, i in first.items():
+            if i >= best_i:
+                break
+            if get(target - num, missing) < i:
+                best_i = i
+                break
+        if best_i == missing:
+            return []
+        indices = positions[target - self.nums[best_i]]
+        return [indices[bisect_left(indices, best_i) - 1], best_i]
+
+    def _query_sorted(self, target: int) -> List[int]:
+        np = self._np
+        values, first_indices = self.values, self.first_indices
+        # values[::-1] is descending, so its complements come out ascending.
+        complements = target - values[::-1]
+        positions = np.searchsorted(values, complements).clip(max=len(values) - 1)
+        matched = np.flatnonzero(values[positions] == complements)
+        value_ids = len(values) - 1 - matched
+        complement_ids = positions[matched]
+
+        candidates = first_indices[value_ids]
+        earlier = first_indices[complement_ids] < candidates
+        i = int(candidates[earlier].min()) if earlier.any() else len(self.nums)
+        halves = value_ids[value_ids == complement_ids]
+        if len(halves):
+            i = min(i, int(self.second_indices[halves[0]]))
+        if i == len(self.nums):
+            return []
+
+        complement = target - self.nums[i]
+        low = int(np.searchsorted(self.sorted_nums, complement, side="left"))
+        high = int(np.searchsorted(self.sorted_nums, complement, side="right"))
+        group = self.order[low:high]
+        return [int(group[np.searchsorted(group, i) - 1]), i]
@@ -1,5 +1,5 @@
 import pytest
-from .two_sum import two_sum
+from .two_sum import TwoSumIndex, two_sum
 
 
 @pytest.mark.parametrize(
@@ -12,3 +12,32 @@ from .two_sum import two_sum
 )
 def test_two_sum(nums, target, expected):
     assert sorted(two_sum(nums, target)) == sorted(expected)
+
+
+@pytest.mark.parametrize("mode", ["hash", "sorted"])
+@pytest.mark.parametrize(
+    "nums, targets",
+    [
+        ([2, 7, 11, 15], [9, 18, 26, 100]),
+        ([3, 3, 1, 3, 5], [6, 4, 8, 2]),
+        ([-1, 0, 1, 0], [0, -1, 1]),
+        ([10**17, 10**17], [2 * 10**17 + 1, 2 * 10**17]),
+        ([2**59, 2**59, 2**59 + 1, 2**59 + 1], [2**60 + 2, 2**60 + 1, 2**60]),
+    ],
+)
+def test_two_sum_index_matches_two_sum(mode, nums, targets):
+    index = TwoSumIndex(nums, mode=mode)
+    assert index.query_many(targets) == [two_sum(nums, target) for target in targets]
+
+
+def test_two_sum_index_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        TwoSumIndex([1, 2], mode="bogus")
+
+
+@pytest.mark.parametrize("mode", ["hash", "sorted"])
+def test_two_sum_index_matches_two_sum_with_repeats(mode):
+    nums = [3, -1, 3, 0, 2, -1, 4, 2, 0, 3]
+    index = TwoSumIndex(nums, mode=mode)
+    targets = range(-3, 9)
+    assert index.query_many(targets) == [two_sum(nums, target) for target in targets]
@@ -4,7 +4,44 @@ How to play blackjack:    https://bicyclecards.com/how-to-play/blackjack/
 "Standard" playing cards: https://en.wikipedia.org/wiki/Standard_52-card_deck
 """
 
-from contextlib import redirect_stdout
+import os
+import random
+import time
+from array import array
+from collections import Counter
+from multiprocessing import Pool
+
+# Compact card encoding: each rank is a small int code, and every two-card
+# predicate is precomputed into a flat 13 x 13 table indexed by code_one * 13 + code_two.
+RANKS = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K')
+CARD_CODES = {rank: code for code, rank in enumerate(RANKS)}
+ACE = CARD_CODES['A']
+CARD_VALUES = array('b', [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10])
+DECK = bytes(code for code in range(len(RANKS)) for _ in range(4))
+
+
+def _pair_table(predicate):
+    return array('b', [predicate(code_one, code_two) for code_one in range(len(RANKS))
+                       for code_two in range(len(RANKS))])
+
+
+def _ace_value(code_one, code_two):
+    if ACE in (code_one, code_two):
+        return 1
+    return 11 if CARD_VALUES[code_one] + CARD_VALUES[code_two] + 11 <= 21 else 1
+
+
+VALUE_OF_ACE_TABLE = _pair_table(_ace_value)
+BLACKJACK_TABLE = _pair_table(
+    lambda code_one, code_two: {CARD_VALUES[code_one], CARD_VALUES[code_two]} == {1, 10})
+SPLIT_TABLE = _pair_table(
+    lambda code_one, code_two: CARD_VALUES[code_one] == CARD_VALUES[code_two])
+DOUBLE_DOWN_TABLE = _pair_table(
+    lambda code_one, code_two: CARD_VALUES[code_one] + CARD_VALUES[code_two] in (9, 10, 11))
+
+
+def _pair_index(card_one, card_two):
+    return CARD_CODES[card_one] * len(RANKS) + CARD_CODES[card_two]
 
 
 def value_of_card(card):
@@ -18,12 +55,7 @@ def value_of_card(card):
     3.  '2' - '10' = numerical value.
     """
 
-    if card in ('J', 'Q', 'K'):
-        return 10
-    elif card == 'A':
-        return 1
-    else:
-        return int(card)
+    return CARD_VALUES[CARD_CODES[card]]
 
 
 def higher_card(card_one, card_two):
@@ -59,15 +91,7 @@ def value_of_ace(card_one, card_two):
     3.  '2' - '10' = numerical value.
     """
 
-    if card_one == 'A' or card_two == 'A':
-        return 1
-
-    sum_of_cards = value_of_card(card_one) + value_of_card(card_two)
-
-    if sum_of_cards + 11 <= 21:
-        return 11
-    else:
-        return 1
+    return VALUE_OF_ACE_TABLE[_pair_index(card_one, card_two)]
 
 
 def is_blackjack(card_one, card_two):
@@ -81,11 +105,7 @@ def is_blackjack(card_one, card_two):
     3.  '2' - '10' = numerical value.
     """
 
-    is_ace = card_one == 'A' or card_two == 'A'
-    is_ten_card = (card_one in ('10', 'J', 'Q', 'K') or
-                   card_two in ('10', 'J', 'Q', 'K'))
-
-    return is_ace and is_ten_card
+    return bool(BLACKJACK_TABLE[_pair_index(card_one, card_two)])
 
 
 def can_split_pairs(card_one, card_two):
@@ -95,7 +115,7 @@ def can_split_pairs(card_one, card_two):
     :return: bool - can the hand be split into two pairs? (i.e. cards are of the same value).
     """
 
-    return value_of_card(card_one) == value_of_card(card_two)
+    return bool(SPLIT_TABLE[_pair_index(card_one, card_two)])
 
 
 def can_double_down(card_one, card_two):
@@ -105,5 +125,69 @@ def can_double_down(card_one, card_two):
     :return: bool - can the hand can be doubled down? (i.e. totals 9, 10 or 11 points).
     """
 
-    sum_of_cards = value_of_card(card_one) + value_of_card(card_two)
-    return sum_of_cards in (9, 10, 11)
+    return bool(DOUBLE_DOWN_TABLE[_pair_index(card_one, card_two)])
+
+
+def deal_pair_counts(hands, decks=6, penetration=0.75, seed=None):
+    """Deal two-card hands from a shuffled shoe and count each starting pair.
+
+    :param hands: int - number of hands to deal.
+    :param decks: int - decks in the shoe.
+    :param penetration: float - fraction of the shoe dealt before reshuffling.
+    :param seed: int or None - seed for the shuffle.
+    :return: Counter - (code_one, code_two) pair -> number of hands dealt.
+    """
+
+    rng = random.Random(seed)
+    shoe = bytearray(DECK * decks)
+    per_shoe = max(1, int(len(shoe) * penetration) // 2)
+    pair_counts = Counter()
+
+    while hands > 0:
+        rng.shuffle(shoe)
+        dealt = min(hands, per_shoe)
+        pair_counts.update(zip(shoe[0:2 * dealt:2], shoe[1:2 * dealt:2]))
+        hands -= dealt
+    return pair_counts
+
+
+def summarize_pairs(pair_counts):
+    """Apply the two-card predicate tables to a pair histogram.
+
+    :param pair_counts: Counter - (code_one, code_two) pair -> number of hands.
+    :return: dict - hands dealt and how many were blackjacks, splittable or double-down hands.
+    """
+
+    summary = {'hands': 0, 'blackjack': 0, 'split': 0, 'double_down': 0}
+    for (code_one, code_two), count in pair_counts.items():
+        index = code_one * len(RANKS) + code_two
+        summary['hands'] += count
+        summary['blackjack'] += count * BLACKJACK_TABLE[index]
+        summary['split'] += count * SPLIT_TABLE[index]
+        summary['double_down'] += count * DOUBLE_DOWN_TABLE[index]
+    return summary
+
+
+def simulate(hands, workers=None, decks=6, seed=None):
+    """Simulate many starting hands across a pool of worker processes.
+
+    :param hands: int - total number of hands to deal.
+    :param workers: int or None - number of processes (defaults to the CPU count).
+    :param decks: int - decks in each worker's shoe.
+    :param seed: int or None - base seed; worker `i` uses `seed + i`.
+    :return: tuple - (summary dict from `summarize_pairs`, hands simulated per second).
+    """
+
+    workers = workers or os.cpu_count() or 1
+    shares = [hands // workers + (i < hands % workers) for i in range(workers)]
+    with Pool(workers) as pool:
+        jobs = [(share, decks, 0.75, None if seed is None else seed + i)
+                for i, share in enumerate(shares)]
+        start = time.perf_counter()
+        partial_counts = pool.starmap(deal_pair_counts, jobs)
+        elapsed = time.perf_counter() - start
+
+    total = Counter()
+    for pair_counts in partial_counts:
+        total.update(pair_counts)
+    return summarize_pairs(total), hands / elapsed if elapsed else float('inf')
@@ -7,7 +7,10 @@ from black_jack import (
                         value_of_ace,
                         is_blackjack,
                         can_split_pairs,
-                        can_double_down
+                        can_double_down,
+                        deal_pair_counts,
+                        summarize_pairs,
+                        simulate
                         )
 
 
@@ -112,3 +115,23 @@ class BlackJackTest(unittest.TestCase):
                              f'but hand {hand} {"can" if expected else "cannot"} be doubled down.')
 
                 self.assertEqual(actual_result, expected, msg=error_msg)
+
+    def test_deal_pair_counts(self):
+        pair_counts = deal_pair_counts(1000, decks=1, seed=7)
+
+        self.assertEqual(sum(pair_counts.values()), 1000)
+        self.assertEqual(pair_counts, deal_pair_counts(1000, decks=1, seed=7))
+
+    def test_summarize_pairs(self):
+        # (A, K) is a blackjack worth 11, (8, 8) can be split, (4, 5) can be doubled down.
+        pair_counts = {(0, 12): 2, (7, 7): 3, (3, 4): 1}
+        expected = {'hands': 6, 'blackjack': 2, 'split': 3, 'double_down': 3}
+
+        self.assertEqual(summarize_pairs(pair_counts), expected)
+
+    def test_simulate(self):
+        summary, hands_per_second = simulate(2000, workers=2, seed=1)
+
+        self.assertEqual(summary['hands'], 2000)
+        self.assertLess(summary['blackjack'], summary['hands'])
+        self.assertGreater(hands_per_second, 0)
@@ -1,13 +1,23 @@
 """Functions for compiling dishes and ingredients for a catering company."""
 
+# The category constants are loaded on first attribute access, so importing this
+# module does not build them; see `sets_categories.py`.
+import sets_categories as categories
 
-from sets_categories_data import (VEGAN,
-                                  VEGETARIAN,
-                                  KETO,
-                                  PALEO,
-                                  OMNIVORE,
-                                  ALCOHOLS,
-                                  SPECIAL_INGREDIENTS)
+
+# Categories a dish can fit, in the order `categorize_dish` tries them.
+CATEGORY_ORDER = ('VEGAN', 'VEGETARIAN', 'PALEO', 'KETO')
+
+
+def _category_sets():
+    return [(name, getattr(categories, name)) for name in CATEGORY_ORDER]
+
+
+def _category(dish_ingredients, category_sets):
+    for category, ingredients in category_sets:
+        if dish_ingredients.issubset(ingredients):
+            return category
+    return 'OMNIVORE'
 
 
 def clean_ingredients(dish_name, dish_ingredients):
@@ -37,7 +47,7 @@ def check_drinks(drink_name, drink_ingredients):
     """
 
     drink_set = set(drink_ingredients)
-    if drink_set.isdisjoint(ALCOHOLS):
+    if drink_set.isdisjoint(categories.ALCOHOLS):
         return f"{drink_name} Mocktail"
     else:
         return f"{drink_name} Cocktail"
@@ -56,16 +66,21 @@ def categorize_dish(dish_name, dish_ingredients):
 
     """
 
-    if dish_ingredients.issubset(VEGAN):
-        return f"{dish_name}: VEGAN"
-    elif dish_ingredients.issubset(VEGETARIAN):
-        return f"{dish_name}: VEGETARIAN"
-    elif dish_ingredients.issubset(PALEO):
-        return f"{dish_name}: PALEO"
-    elif dish_ingredients.issubset(KETO):
-        return f"{dish_name}: KETO"
-    else:
-        return f"{dish_name}: OMNIVORE"
+    return f"{dish_name}: {_category(dish_ingredients, _category_sets())}"
+
+
+def categorize_many(dishes):
+    """Categorize a whole menu in one pass.
+
+    :param dishes: iterable - of (dish name, dish ingredient set) pairs.
+    :return: list - of "dish name: <CATEGORY>" strings, in menu order.
+
+    The category sets are looked up once for the whole menu rather than once per dish.
+    """
+
+    category_sets = _category_sets()
+    return [f"{dish_name}: {_category(dish_ingredients, category_sets)}"
+            for dish_name, dish_ingredients in dishes]
 
 
 def tag_special_ingredients(dish):
@@ -80,7 +95,7 @@ def tag_special_ingredients(dish):
     """
 
     dish_name, dish_ingredients = dish
-    return (dish_name, set(dish_ingredients).intersection(SPECIAL_INGREDIENTS))
+    return (dish_name, set(categories.SPECIAL_INGREDIENTS.intersection(dish_ingredients)))
 
 
 def compile_ingredients(dishes):
@@ -114,7 +129,7 @@ def separate_appetizers(dishes, appetizers):
     return list(dishes_set.difference(appetizers_set))
 
 
-def singleton_ingredients(dishes, intersection):
+def singleton_ingredients(dishes, intersection=None):
     """Determine which `dishes` have a singleton ingredient (an ingredient that only appears once across dishes).
 
     :param dishes: list - of ingredient sets.
@@ -127,9 +142,209 @@ def singleton_ingredients(dishes, intersection):
         (VEGAN, VEGETARIAN, PALEO, KETO, or OMNIVORE).
 
     The function should return a `set` of ingredients that only appear in a single dish.
+    Singletons are now counted directly from `dishes` (see `count_singletons`), so `intersection`
+    is accepted for compatibility but no longer needed.
     """
 
-    all_ingredients = set()
+    return count_singletons(dishes)
+
+
+def count_singletons(dishes):
+    """Find the ingredients that appear in exactly one dish, in a single pass.
+
+    :param dishes: iterable - of ingredient sets (any collection of dishes, not just one category).
+    :return: set - containing singleton ingredients.
+    """
+
+    once = set()
+    many = set()
     for dish_ingredients in dishes:
-        all_ingredients.update(dish_ingredients)
-    return all_ingredients.difference(intersection)
+        for ingredient in dish_ingredients:
+            if ingredient in many:
+                continue
+            if ingredient in once:
+                once.remove(ingredient)
+                many.add(ingredient)
+            else:
+                once.add(ingredient)
+    return once
+
+
+class SingletonTracker:
+    """Keep the singleton ingredients of an editable menu up to date.
+
+    Adding or removing a dish costs O(len(dish)); `singletons` is always current.
+    """
+
+    def __init__(self, dishes=()):
+        self.counts = {}
+        self.singletons = set()
+        for dish_ingredients in dishes:
+            self.add(dish_ingredients)
+
+    def add(self, dish_ingredients):
+        """Add a dish (a set of ingredients) to the menu."""
+
+        for ingredient in dish_ingredients:
+            count = self.counts.get(ingredient, 0) + 1
+            self.counts[ingredient] = count
+            if count == 1:
+                self.singletons.add(ingredient)
+            elif count == 2:
+                self.singletons.discard(ingredient)
+
+    def remove(self, dish_ingredients):
+        """Remove a previously added dish from the menu."""
+
+        for ingredient in dish_ingredients:
+            count = self.counts[ingredient] - 1
+            if count:
+                self.counts[ingredient] = count
+                if count == 1:
+                    self.singletons.add(ingredient)
+            else:
+                del self.counts[ingredient]
+                self.singletons.discard(ingredient)
+
+
+class IngredientIndex:
+    """An inverted index from ingredients (and categories) to the dishes that use them.
+
+    Dishes get ids in the order they are added, and each posting list is a
+    list of dish ids. Ids are only ever appended, so every posting list
+    stays sorted without any sorting. Queries return sorted lists of dish ids,
+    which `names` turns back into dish names.
+    """
+
+    def __init__(self, records=()):
+        self.dish_names = []
+        self.postings = {}
+        self.category_postings = {}
+        self._category_sets = None
+        for dish_name, dish_ingredients in records:
+            self.add(dish_name, dish_ingredients)
+
+    def add(self, dish_name, dish_ingredients):
+        """Index one dish and return its id."""
+
+        dish_id = len(self.dish_names)
+        self.dish_names.append(dish_name)
+        dish_ingredients = set(dish_ingredients)
+        postings = self.postings
+        for ingredient in dish_ingredients:
+            posting = postings.get(ingredient)
+            if posting is None:
+                posting = postings[ingredient] = []
+            posting.append(dish_id)
+
+        if self._category_sets is None:
+            self._category_sets = _category_sets()
+        category = _category(dish_ingredients, self._category_sets)
+        self.category_postings.setdefault(category, []).append(dish_id)
+        return dish_id
+
+    @property
+    def all_dishes(self):
+        return range(len(self.dish_names))
+
+    def posting(self, ingredient):
+        """Return the sorted ids of the dishes containing `ingredient`."""
+
+        return self.postings.get(ingredient, ())
+
+    def containing_all(self, ingredients):
+        """Return the sorted ids of the dishes containing every one of `ingredients`.
+
+        The shortest posting list is intersected with the others by binary
+        search, so the cost follows the rarest ingredient, not the menu size.
+        """
+
+        from bisect import bisect_left
+
+        postings = sorted((self.posting(ingredient) for ingredient in set(ingredients)), key=len)
+        if not postings:
+            return list(self.all_dishes)
+        found = list(postings[0])
+        for posting in postings[1:]:
+            if not found:
+                break
+            size = len(posting)
+            kept = []
+            low = 0
+            for dish_id in found:
+                low = bisect_left(posting, dish_id, low)
+                if low == size:
+                    break
+                if posting[low] == dish_id:
+                    kept.append(dish_id)
+            found = kept
+        return found
+
+    def containing_any(self, ingredients):
+        """Return the sorted ids of the dishes containing at least one of `ingredients`."""
+
+        found = set()
+        for ingredient in ingredients:
+            found.update(self.posting(ingredient))
+        return sorted(found)
+
+    def avoiding(self, ingredients):
+        """Return the sorted ids of the dishes containing none of `ingredients` (e.g. `ALCOHOLS`)."""
+
+        excluded = set()
+        for ingredient in ingredients:
+            excluded.update(self.posting(ingredient))
+        return [dish_id for dish_id in self.all_dishes if dish_id not in excluded]
+
+    def in_category(self, category):
+        """Return the sorted ids of the dishes in `category` (VEGAN, VEGETARIAN, PALEO, KETO or OMNIVORE)."""
+
+        return self.category_postings.get(category, ())
+
+    def names(self, dish_ids):
+        """Return the names of the dishes with the given ids, in the same order."""
+
+        dish_names = self.dish_names
+        return [dish_names[dish_id] for dish_id in dish_ids]
+
+    def save(self, path):
+        """Write the index to `path` as JSON, with posting lists stored as lists of ids."""
+
+        import json
+
+        data = {
+            'dish_names': self.dish_names,
+            'postings': self.postings,
+            'category_postings': self.category_postings,
+        }
+        with open(path, 'w', encoding='utf-8') as index_file:
+            json.dump(data, index_file)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by `save`, without re-categorizing any dish."""
+
+        import json
+
+        with open(path, encoding='utf-8') as index_file:
+            data = json.load(index_file)
+        index = cls()
+        index.dish_names = data['dish_names']
+        index.postings = data['postings']
+        index.category_postings = data['category_postings']
+        return index
+
+
+if __name__ == '__main__':
+    from timeit import timeit
+
+    from sets_test_data import recipes_without_duplicates
+
+    menu = [(name, ingredients) for _, name, ingredients in recipes_without_duplicates] * 100
+    approaches = [
+        ('categorize_dish', lambda: [categorize_dish(name, ingredients) for name, ingredients in menu]),
+        ('categorize_many', lambda: categorize_many(menu)),
+    ]
+    for approach, run in approaches:
+        seconds = min(timeit(run, number=1) for _ in range(5))
+        print(f'{approach:>15}: {seconds * 1e6:9.1f} us for {len(menu)} dishes')
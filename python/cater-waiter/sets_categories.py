@@ -0,0 +1,27 @@
+"""Lazily loaded category constants from `sets_categories_data.py`.
+
+`sets_categories_data.py` builds every category set as soon as it is imported.
+This module exposes the same names (VEGAN, ALCOHOLS, ..., example_dishes) but
+only imports `sets_categories_data` on the first attribute access, so code that
+imports `sets` without touching a category (e.g. `clean_ingredients`) never
+builds them. After that, every name is the data module's own object.
+"""
+
+import importlib
+
+DATA_MODULE = 'sets_categories_data'
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    try:
+        value = getattr(importlib.import_module(DATA_MODULE), name)
+    except AttributeError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    globals()[name] = value  # later lookups are plain module attributes
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(dir(importlib.import_module(DATA_MODULE))))
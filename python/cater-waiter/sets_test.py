@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 import pytest
 
@@ -5,11 +9,17 @@ import pytest
 from sets import (clean_ingredients,
                   check_drinks,
                   categorize_dish,
+                  categorize_many,
                   tag_special_ingredients,
                   compile_ingredients,
                   separate_appetizers,
-                  singleton_ingredients)
+                  singleton_ingredients,
+                  count_singletons,
+                  SingletonTracker,
+                  IngredientIndex)
 
+import sets_categories
+import sets_categories_data
 
 from sets_categories_data import (VEGAN,
                                   VEGETARIAN,
@@ -35,7 +45,8 @@ from sets_test_data import (recipes_with_duplicates,
                             dishes_and_appetizers,
                             dishes_cleaned,
                             dishes_and_overlap,
-                            singletons)
+                            singletons,
+                            backup_singletons)
 
 
 class SetsTest(unittest.TestCase):
@@ -117,3 +128,94 @@ class SetsTest(unittest.TestCase):
                 error_message = ("Expected only ingredients that belong to exactly "
                                 "one dish, but got multi-dish ingredients instead.")
                 self.assertEqual(singleton_ingredients(item[0], item[1]), (result), msg=error_message)
+
+    def test_categorize_many(self):
+        menu = [(name, ingredients) for _, name, ingredients in recipes_without_duplicates]
+        expected = [categorize_dish(name, ingredients) for name, ingredients in menu]
+
+        self.assertEqual(categorize_many(menu), expected)
+
+    def test_count_singletons(self):
+        for dishes, result in zip(ingredients_only, backup_singletons):
+            self.assertEqual(count_singletons(dishes), result)
+
+    def test_singletons_across_categories(self):
+        dishes = [{'tofu', 'rice'}, {'rice', 'beef'}, {'beef', 'salt', 'rum'}]
+
+        self.assertEqual(count_singletons(dishes), {'tofu', 'salt', 'rum'})
+
+    def test_singleton_tracker(self):
+        tracker = SingletonTracker([{'tofu', 'rice'}, {'rice', 'beef'}])
+        self.assertEqual(tracker.singletons, {'tofu', 'beef'})
+
+        tracker.add({'tofu', 'salt'})
+        self.assertEqual(tracker.singletons, {'beef', 'salt'})
+
+        tracker.remove({'rice', 'beef'})
+        self.assertEqual(tracker.singletons, {'rice', 'salt'})
+
+    def test_ingredient_index_queries(self):
+        index = IngredientIndex([('Mojito', {'white rum', 'mint', 'lime'}),
+                                 ('Lemonade', {'lemon', 'sugar', 'water'}),
+                                 ('Mint Tea', {'mint', 'water', 'sugar'})])
+
+        self.assertEqual(index.names(index.posting('mint')), ['Mojito', 'Mint Tea'])
+        self.assertEqual(index.names(index.containing_all(['water', 'mint'])), ['Mint Tea'])
+        self.assertEqual(index.names(index.containing_any(['lime', 'lemon'])), ['Mojito', 'Lemonade'])
+        self.assertEqual(index.names(index.avoiding(ALCOHOLS)), ['Lemonade', 'Mint Tea'])
+        self.assertEqual(index.names(index.in_category('VEGAN')), ['Lemonade'])
+
+    def test_ingredient_index_containing_all_matches_sets(self):
+        index = IngredientIndex((name, ingredients) for _, name, ingredients in recipes_without_duplicates)
+        queries = [['garlic', 'salt'], ['olive oil', 'garlic', 'lemon juice'], ['salt', 'unheard-of root'], []]
+
+        for query in queries:
+            with self.subTest(query=query):
+                expected = [dish_id for dish_id, (_, _, ingredients) in enumerate(recipes_without_duplicates)
+                            if ingredients.issuperset(query)]
+                self.assertEqual(list(index.containing_all(query)), expected)
+
+    def test_ingredient_index_matches_categorize_dish(self):
+        index = IngredientIndex((name, ingredients) for _, name, ingredients in recipes_without_duplicates)
+
+        for category in ('VEGAN', 'VEGETARIAN', 'PALEO', 'KETO', 'OMNIVORE'):
+            expected = [name for _, name, ingredients in recipes_without_duplicates
+                        if categorize_dish(name, ingredients) == f'{name}: {category}']
+            self.assertEqual(index.names(index.in_category(category)), expected)
+
+    def test_ingredient_index_save_and_load(self):
+        index = IngredientIndex((name, ingredients) for _, name, ingredients in recipes_without_duplicates)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'index.json')
+            index.save(path)
+            loaded = IngredientIndex.load(path)
+
+        self.assertEqual(loaded.dish_names, index.dish_names)
+        self.assertEqual(loaded.postings, index.postings)
+        self.assertEqual(loaded.category_postings, index.category_postings)
+
+    def test_lazy_categories_match_data_module(self):
+        for name in ('VEGAN', 'VEGETARIAN', 'PALEO', 'KETO', 'OMNIVORE', 'ALCOHOLS',
+                     'SPECIAL_INGREDIENTS', 'OMNIVORE_INTERSECTIONS'):
+            with self.subTest(name=name):
+                self.assertIs(getattr(sets_categories, name), getattr(sets_categories_data, name))
+
+        self.assertIs(sets_categories.example_dishes, sets_categories_data.example_dishes)
+        with self.assertRaises(AttributeError):
+            getattr(sets_categories, 'NOT_A_CATEGORY')
+
+    def test_tag_special_ingredients_returns_a_set(self):
+        self.assertEqual(tag_special_ingredients(('Fries', ['potatoes', 'salt', 'cream'])), ('Fries', {'cream'}))
+        self.assertIs(type(tag_special_ingredients(('Fries', ['cream']))[1]), set)
+
+    def test_lazy_categories_import_data_on_first_access(self):
+        script = ('import sys\n'
+                  'import sets\n'
+                  'print("sets_categories_data" in sys.modules)\n'
+                  'sets.check_drinks("Mojito", ["lime"])\n'
+                  'print("sets_categories_data" in sys.modules)\n')
+        result = subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.split(), ['False', 'True'])
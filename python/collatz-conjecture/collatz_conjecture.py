@@ -1,12 +1,148 @@
-def steps(number):
-    if number <= 0:
+from array import array
+
+# Size single calls pre-size the table to on first use (256 KB of int32).
+DEFAULT_TABLE_SIZE = 1 << 16
+MAX_TABLE_SIZE = 1 << 22
+UNKNOWN = -1
+# Largest value whose 3n + 1 still fits in an int64.
+MAX_VECTOR_VALUE = (2**63 - 2) // 3
+# Starting values stepped together in the first NumPy block of steps_batch.
+VECTOR_BLOCK_SIZE = 1 << 14
+
+# known_steps[n] holds the step count for n, or UNKNOWN. Index 0 is unused.
+known_steps = array("i", [UNKNOWN, 0])
+
+
+def _grow_table(limit):
+    """
+    Extend the step table to cover starting values below `limit`.
+    """
+    limit = min(limit, MAX_TABLE_SIZE)
+    if limit > len(known_steps):
+        known_steps.extend(array("i", [UNKNOWN]) * (limit - len(known_steps)))
+
+
+def clear_table():
+    """
+    Release the step table, back to its initial two entries.
+    """
+    del known_steps[2:]
+
+
+def _positive_int(number):
+    if number <= 0 or int(number) != number:
         raise ValueError("Only positive integers are allowed")
+    return int(number)
+
+
+def steps(number):
+    number = _positive_int(number)
+    if len(known_steps) < DEFAULT_TABLE_SIZE:
+        _grow_table(DEFAULT_TABLE_SIZE)
+    return _cached_steps(number, len(known_steps))
+
 
+def _cached_steps(number, table_size):
+    """
+    Count steps until the trajectory reaches a value already in the table,
+    then cache the count of every value on the way that the table covers.
+    """
+    trajectory = []  # (value, steps taken before reaching it), table values only
     counter = 0
-    while number != 1:
+    while number >= table_size or known_steps[number] == UNKNOWN:
+        if number < table_size:
+            trajectory.append((number, counter))
         if number % 2 == 0:
             number = number//2
         else:
             number = (number*3 + 1)
-        counter+= 1
-    return counter
+        counter += 1
+
+    total = counter + known_steps[number]
+    for value, taken in trajectory:
+        known_steps[value] = total - taken
+    return total
+
+
+def _vector_block(np, table, starts):
+    """
+    Step every starting value in an int64 array at once, finishing each one as
+    soon as it reaches a value already in the table.
+    """
+    table_size = len(table)
+    results = np.empty(len(starts), dtype=np.int64)
+    positions = np.arange(len(starts))
+    current = starts.copy()
+    counters = np.zeros(len(starts), dtype=np.int64)
+
+    while len(positions):
+        known = np.full(len(current), UNKNOWN, dtype=np.int64)
+        in_table = current < table_size
+        known[in_table] = table[current[in_table]]
+        # Values that could overflow int64 on their next odd step finish in Python.
+        finished = (known != UNKNOWN) | (current > MAX_VECTOR_VALUE)
+        for index in np.flatnonzero(finished & (known == UNKNOWN)).tolist():
+            known[index] = _cached_steps(int(current[index]), table_size)
+        results[positions[finished]] = counters[finished] + known[finished]
+
+        running = ~finished
+        positions, current, counters = positions[running], current[running], counters[running]
+        odd = (current & 1).astype(bool)
+        current = np.where(odd, 3 * current + 1, current >> 1)
+        counters += 1
+    return results
+
+
+def _vector_steps(np, starts):
+    """
+    Step `starts` in ascending blocks, caching each block in the table before
+    the next, so most trajectories soon drop onto an already known value.
+    Blocks double in size, so each one is about as large as everything
+    already cached.
+    """
+    table = np.frombuffer(known_steps, dtype=np.intc)
+    order = np.argsort(starts, kind="stable")
+    results = np.empty(len(starts), dtype=np.int64)
+    block, block_size = 0, VECTOR_BLOCK_SIZE
+    while block < len(starts):
+        indices = order[block:block + block_size]
+        block, block_size = block + block_size, max(block_size, block + block_size)
+        block_starts = starts[indices]
+        block_results = _vector_block(np, table, block_starts)
+        cached = block_starts < len(table)
+        table[block_starts[cached]] = block_results[cached]
+        results[indices] = block_results
+    return results
+
+
+def steps_batch(numbers):
+    """
+    Return the step counts for every starting value in `numbers`.
+
+    The step table is grown to cover the largest value first (up to
+    MAX_TABLE_SIZE entries, kept until `clear_table`). The values are then
+    stepped as NumPy arrays (batches of at least VECTOR_BLOCK_SIZE values
+    below MAX_VECTOR_VALUE), in ascending blocks whose counts are written to
+    the table before the next block runs.
+    """
+    if isinstance(numbers, range):
+        if numbers and min(numbers) <= 0:
+            raise ValueError("Only positive integers are allowed")
+    else:
+        numbers = [_positive_int(number) for number in numbers]
+    if not numbers:
+        return []
+    if len(numbers) < VECTOR_BLOCK_SIZE or max(numbers) > MAX_VECTOR_VALUE:
+        # Too few values to amortize NumPy's per-step overhead, or too large for int64.
+        _grow_table(max(DEFAULT_TABLE_SIZE, min(max(numbers) + 1, MAX_TABLE_SIZE)))
+        return [_cached_steps(number, len(known_steps)) for number in numbers]
+
+    import numpy as np
+
+    if isinstance(numbers, range):
+        starts = np.arange(numbers.start, numbers.stop, numbers.step, dtype=np.int64)
+    else:
+        starts = np.array(numbers, dtype=np.int64)
+
+    _grow_table(int(starts.max()) + 1)
+    return _vector_steps(np, starts).tolist()
@@ -2,10 +2,15 @@
 # https://github.com/exercism/problem-specifications/tree/main/exercises/collatz-conjecture/canonical-data.json
 # File last updated on 2023-07-20
 
+import importlib.util
 import unittest
 
 from collatz_conjecture import (
+    DEFAULT_TABLE_SIZE,
+    clear_table,
+    known_steps,
     steps,
+    steps_batch,
 )
 
 
@@ -33,3 +38,50 @@ class CollatzConjectureTest(unittest.TestCase):
             steps(-15)
         self.assertEqual(type(err.exception), ValueError)
         self.assertEqual(err.exception.args[0], "Only positive integers are allowed")
+
+    # Additional tests for this track
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_batch_over_a_range(self):
+        self.assertEqual(steps_batch(range(1, 8)), [0, 1, 7, 2, 5, 8, 16])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_batch_matches_single_calls(self):
+        numbers = [27, 1000000, 97, 12]
+        self.assertEqual(steps_batch(numbers), [steps(number) for number in numbers])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_batch_beyond_the_step_table(self):
+        self.assertEqual(steps_batch([2**40]), [40])
+
+    def test_batch_with_non_positive_value_is_an_error(self):
+        with self.assertRaises(ValueError) as err:
+            steps_batch(range(-1, 5))
+        self.assertEqual(type(err.exception), ValueError)
+        self.assertEqual(err.exception.args[0], "Only positive integers are allowed")
+
+    def test_single_calls_fill_a_bounded_table(self):
+        clear_table()
+        self.assertEqual(steps(3000000), 112)
+        self.assertEqual(len(known_steps), DEFAULT_TABLE_SIZE)
+        steps(27)
+        self.assertEqual((known_steps[27], known_steps[82]), (111, 110))
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_batch_matches_single_calls_across_the_table_edge(self):
+        clear_table()
+        numbers = list(range(1, 40000)) + [2**61 + 1, 77031]
+        expected = [steps(number) for number in numbers]
+        clear_table()
+        self.assertEqual(steps_batch(numbers), expected)
+        self.assertEqual(steps_batch(range(1, 40000, 2)), expected[:39999:2])
+        self.assertEqual(steps_batch(numbers + [2**62 + 3]), expected + [steps(2**62 + 3)])
+
+    def test_integral_float_is_accepted(self):
+        self.assertEqual(steps(4.0), 2)
+        self.assertEqual(steps_batch([2**70 + 0.0, 4.0]), [steps(2**70), 2])
+
+    def test_non_integral_value_is_an_error(self):
+        with self.assertRaises(ValueError) as err:
+            steps(2.5)
+        self.assertEqual(err.exception.args[0], "Only positive integers are allowed")
@@ -1,14 +1,69 @@
 import math
 
+RING_RADII = (1, 5, 10)
+RING_SCORES = (10, 5, 1, 0)
+
+
+def _squared_limit(radius):
+    """
+    Largest float t with sqrt(t) <= radius, so `x*x + y*y <= t` agrees with
+    `sqrt(x*x + y*y) <= radius` even where sqrt rounds down onto the radius.
+    """
+    limit = float(radius * radius)
+    while math.sqrt(math.nextafter(limit, math.inf)) <= radius:
+        limit = math.nextafter(limit, math.inf)
+    while math.sqrt(limit) > radius:
+        limit = math.nextafter(limit, -math.inf)
+    return limit
+
+
+SQUARED_LIMITS = tuple(_squared_limit(radius) for radius in RING_RADII)
+
+
 def score(x, y):
     """
     Calculate the score in a darts game.
     """
-    distance = math.sqrt(x**2 + y**2)
+    distance = math.sqrt(x * x + y * y)
     if distance <= 1:
         return 10
     elif distance <= 5:
         return 5
     elif distance <= 10:
         return 1
-    return 0
\ No newline at end of file
+    return 0
+
+
+def _ring_indices(np, xs, ys):
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    squared = xs * xs
+    squared += ys * ys
+    return np.searchsorted(SQUARED_LIMITS, squared, side="left")
+
+
+def score_many(xs, ys):
+    """
+    Score many throws at once from NumPy arrays (or sequences) of coordinates.
+
+    Squared radii are compared against precomputed squared ring limits, so
+    there is no square root and the results match `score` exactly.
+    """
+    import numpy as np
+
+    return np.asarray(RING_SCORES)[_ring_indices(np, xs, ys)]
+
+
+def score_histogram(throws):
+    """
+    Count how many throws land on each score, from an iterable of (xs, ys)
+    array chunks, without keeping per-throw results.
+
+    Returns a dict mapping each score (10, 5, 1, 0) to its count.
+    """
+    import numpy as np
+
+    counts = np.zeros(len(RING_SCORES), dtype=np.int64)
+    for xs, ys in throws:
+        counts += np.bincount(_ring_indices(np, xs, ys), minlength=len(RING_SCORES))
+    return dict(zip(RING_SCORES, counts.tolist()))
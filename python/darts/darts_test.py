@@ -2,10 +2,13 @@
 # https://github.com/exercism/problem-specifications/tree/main/exercises/darts/canonical-data.json
 # File last updated on 2023-07-19
 
+import importlib.util
 import unittest
 
 from darts import (
     score,
+    score_histogram,
+    score_many,
 )
 
 
@@ -48,3 +51,16 @@ class DartsTest(unittest.TestCase):
 
     def test_asymmetric_position_between_the_inner_and_middle_circles(self):
         self.assertEqual(score(0.5, -4), 5)
+
+    # Additional tests for this track
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_score_many_matches_score(self):
+        xs = [-9, 0, -5, 0, -0.1, 0, 0.4, 0.8, -3.5, 3.6, -7.0, 7.1, 0.5, 1 + 2**-52]
+        ys = [9, 10, 0, -1, 0.1, 0.7, 0.8, -0.8, 3.5, 3.6, 7.0, 7.1, -4, 0]
+        self.assertEqual(score_many(xs, ys).tolist(), [score(x, y) for x, y in zip(xs, ys)])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_score_histogram_over_chunks(self):
+        chunks = [([0, 3, 9], [0, 4, 0]), ([20, -1], [0, 0])]
+        self.assertEqual(score_histogram(chunks), {10: 2, 5: 1, 1: 1, 0: 1})
@@ -1,6 +1,45 @@
+from array import array
+
+TABLE_SIZE = 256
+
+
+def _conflict(letter, old_score, new_score):
+    return ValueError(f"letter {letter!r} scored both {old_score} and {new_score}")
+
+
+def transform_rows(rows, strict=False):
+    """
+    Lazily convert (score, letters) rows into (letter, score) pairs.
+
+    Conflicting scores for a letter are detected as the rows stream past:
+    with `strict` they raise ValueError, otherwise the later score is yielded
+    and wins, exactly as in `transform`.
+    """
+    scores = {}
+    for score, letters in rows:
+        for letter in map(str.lower, letters):
+            old_score = scores.setdefault(letter, score)
+            if old_score != score:
+                if strict:
+                    raise _conflict(letter, old_score, score)
+                scores[letter] = score
+            yield letter, score
+
+
 def transform(legacy_data):
-    new_data = {}
-    for score, letters in legacy_data.items():
-        for letter in letters:
-            new_data[letter.lower()] = score
-    return new_data
+    return dict(transform_rows(legacy_data.items()))
+
+
+def score_table(rows, strict=False):
+    """
+    Build a 256-entry array mapping each lowercase letter's code point to its
+    score (0 where a letter has none), in the same single pass as
+    `transform_rows`.
+    """
+    table = array("i", [0]) * TABLE_SIZE
+    for letter, score in transform_rows(rows, strict):
+        code = ord(letter)
+        if code >= TABLE_SIZE:
+            raise ValueError(f"letter {letter!r} does not fit in the score table")
+        table[code] = score
+    return table
@@ -5,7 +5,9 @@
 import unittest
 
 from etl import (
+    score_table,
     transform,
+    transform_rows,
 )
 
 
@@ -64,3 +66,28 @@ class EtlTest(unittest.TestCase):
             "z": 10,
         }
         self.assertEqual(transform(legacy_data), data)
+
+    # Additional tests for this track
+
+    def test_transform_rows_is_lazy(self):
+        rows = iter([(1, ["A", "E"]), (2, ["D"])])
+        pairs = transform_rows(rows)
+        self.assertEqual(next(pairs), ("a", 1))
+        self.assertEqual(list(pairs), [("e", 1), ("d", 2)])
+
+    def test_conflicting_scores_keep_the_later_score(self):
+        legacy_data = {1: ["A"], 2: ["A", "B"]}
+        self.assertEqual(transform(legacy_data), {"a": 2, "b": 2})
+
+    def test_strict_rows_reject_conflicting_scores(self):
+        with self.assertRaises(ValueError) as err:
+            list(transform_rows([(1, ["A"]), (2, ["a"])], strict=True))
+        self.assertEqual(err.exception.args[0], "letter 'a' scored both 1 and 2")
+
+    def test_score_table(self):
+        table = score_table([(1, ["A", "E"]), (10, ["Q", "Z"])])
+        self.assertEqual(len(table), 256)
+        self.assertEqual(
+            {chr(code): score for code, score in enumerate(table) if score},
+            {"a": 1, "e": 1, "q": 10, "z": 10},
+        )
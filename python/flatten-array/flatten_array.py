@@ -1,8 +1,34 @@
+from collections.abc import Iterable, Mapping
+
+# Iterables that are values in their own right and are never descended into.
+ATOMIC_TYPES = (str, bytes, bytearray, Mapping)
+
+
+def _is_nested(item):
+    if isinstance(item, (list, tuple)):
+        return True
+    return isinstance(item, Iterable) and not isinstance(item, ATOMIC_TYPES)
+
+
+def iflatten(iterable, max_depth=None, keep_none=False):
+    """
+    Lazily yield the leaves of a nested iterable, using an explicit stack.
+
+    Lists, tuples and other iterables are descended into, except strings,
+    bytes and mappings. Iterables nested deeper than `max_depth` levels are
+    yielded unflattened, and None leaves are dropped unless `keep_none`.
+    """
+    stack = [iter(iterable)]
+    while stack:
+        for item in stack[-1]:
+            if _is_nested(item) and (max_depth is None or len(stack) <= max_depth):
+                stack.append(iter(item))
+                break
+            if item is not None or keep_none:
+                yield item
+        else:
+            stack.pop()
+
+
 def flatten(iterable):
-    result = []
-    for item in iterable:
-        if isinstance(item, list):
-            result.extend(flatten(item))
-        elif item is not None:
-            result.append(item)
-    return result
+    return list(iflatten(iterable))
@@ -6,6 +6,7 @@ import unittest
 
 from flatten_array import (
     flatten,
+    iflatten,
 )
 
 
@@ -68,3 +69,30 @@ class FlattenArrayTest(unittest.TestCase):
         inputs = [None, [[[None]]], None, None, [[None, None], None], None]
         expected = []
         self.assertEqual(flatten(inputs), expected)
+
+    # Additional tests for this track
+
+    def test_deep_nesting_does_not_hit_the_recursion_limit(self):
+        inputs = [1]
+        for _ in range(10000):
+            inputs = [inputs, 2]
+        self.assertEqual(flatten(inputs), [1] + [2] * 10000)
+
+    def test_tuples_and_iterables_are_flattened_but_strings_are_not(self):
+        inputs = [(1, "ab"), range(2, 4), [b"cd", {"e": 5}]]
+        self.assertEqual(flatten(inputs), [1, "ab", 2, 3, b"cd", {"e": 5}])
+
+    def test_iflatten_is_lazy(self):
+        leaves = iflatten([0, [1, [2]]])
+        self.assertEqual(next(leaves), 0)
+        self.assertEqual(list(leaves), [1, 2])
+
+    def test_iflatten_max_depth(self):
+        inputs = [0, [1, [2, [3]]]]
+        self.assertEqual(list(iflatten(inputs, max_depth=0)), [0, [1, [2, [3]]]])
+        self.assertEqual(list(iflatten(inputs, max_depth=1)), [0, 1, [2, [3]]])
+        self.assertEqual(list(iflatten(inputs, max_depth=2)), [0, 1, 2, [3]])
+
+    def test_iflatten_keep_none(self):
+        inputs = [None, [1, None]]
+        self.assertEqual(list(iflatten(inputs, keep_none=True)), [None, 1, None])
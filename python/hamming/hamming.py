@@ -1,3 +1,10 @@
+import mmap
+
+BLOCK_SIZE = 1 << 16
+# Byte comparisons done at once per block of rows in distance_matrix.
+MATRIX_BLOCK_BYTES = 1 << 22
+
+
 def distance(strand_a, strand_b):
     """
     Calculate the Hamming distance between two DNA strands.
@@ -5,4 +12,79 @@ def distance(strand_a, strand_b):
     if len(strand_a) != len(strand_b):
         raise ValueError("Strands must be of equal length.")
 
-    return sum(a != b for a, b in zip(strand_a, strand_b))
\ No newline at end of file
+    return sum(a != b for a, b in zip(strand_a, strand_b))
+
+
+def map_strand(path):
+    """
+    Memory-map a strand file read-only so it can be compared without loading it.
+    """
+    with open(path, "rb") as strand_file:
+        return mmap.mmap(strand_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def bytes_distance(strand_a, strand_b, threshold=None, block_size=BLOCK_SIZE):
+    """
+    Calculate the Hamming distance between two byte buffers (bytes, mmap, ...).
+
+    Both buffers are compared as NumPy uint8 views, without copying. With a
+    `threshold`, counting stops at the first block where the distance exceeds
+    it, so any returned value above `threshold` means "too far".
+    """
+    import numpy as np
+
+    if len(strand_a) != len(strand_b):
+        raise ValueError("Strands must be of equal length.")
+
+    view_a = np.frombuffer(strand_a, dtype=np.uint8)
+    view_b = np.frombuffer(strand_b, dtype=np.uint8)
+    total = 0
+    for start in range(0, len(view_a), block_size):
+        stop = start + block_size
+        total += int(np.count_nonzero(view_a[start:stop] != view_b[start:stop]))
+        if threshold is not None and total > threshold:
+            break
+    return total
+
+
+def distances(read, reads, threshold=None):
+    """
+    Calculate the distance from one read to each of many reads (one-to-many).
+    """
+    return [bytes_distance(read, other, threshold) for other in reads]
+
+
+def distance_matrix(reads, threshold=None, block_size=BLOCK_SIZE):
+    """
+    Calculate the symmetric all-pairs distance matrix as an int64 ndarray.
+
+    Rows are compared in blocks of about MATRIX_BLOCK_BYTES byte comparisons.
+    With a `threshold`, a block stops counting once every pair in it exceeds
+    the threshold, after which its entries only mean "too far".
+    """
+    import numpy as np
+
+    reads = list(reads)
+    if len({len(read) for read in reads}) > 1:
+        raise ValueError("Strands must be of equal length.")
+    count = len(reads)
+    length = len(reads[0]) if reads else 0
+    matrix = np.zeros((count, count), dtype=np.int64)
+    if not count or not length:
+        return matrix
+
+    strands = np.frombuffer(b"".join(reads), dtype=np.uint8).reshape(count, length)
+    rows_per_block = max(1, MATRIX_BLOCK_BYTES // (count * min(length, block_size)))
+    for first in range(0, count, rows_per_block):
+        rows = strands[first:first + rows_per_block, None, :]
+        others = strands[None, first:, :]  # pairs left of `first` are mirrored below
+        block = matrix[first:first + rows_per_block, first:]
+        pairs = np.triu(np.ones(block.shape, dtype=bool), 1)
+        for start in range(0, length, block_size):
+            stop = start + block_size
+            block += np.count_nonzero(rows[..., start:stop] != others[..., start:stop], axis=2)
+            if threshold is not None and (block[pairs] > threshold).all():
+                break
+
+    upper = np.triu(matrix)
+    return upper + upper.T
@@ -2,10 +2,17 @@
 # https://github.com/exercism/problem-specifications/tree/main/exercises/hamming/canonical-data.json
 # File last updated on 2023-07-19
 
+import importlib.util
+import os
+import tempfile
 import unittest
 
 from hamming import (
+    bytes_distance,
     distance,
+    distance_matrix,
+    distances,
+    map_strand,
 )
 
 
@@ -52,3 +59,67 @@ class HammingTest(unittest.TestCase):
 
         self.assertEqual(type(err.exception), ValueError)
         self.assertEqual(err.exception.args[0], "Strands must be of equal length.")
+
+    # Additional tests for this track
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_bytes_distance_matches_distance(self):
+        self.assertEqual(bytes_distance(b"GGACGGATTCTG", b"AGGACGGATTCT"), 9)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_bytes_distance_across_blocks(self):
+        strand_a = b"ACGT" * 1000
+        strand_b = b"ACGA" * 1000
+        self.assertEqual(bytes_distance(strand_a, strand_b, block_size=7), 1000)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_bytes_distance_disallows_different_lengths(self):
+        with self.assertRaises(ValueError) as err:
+            bytes_distance(b"AATG", b"AAA")
+        self.assertEqual(err.exception.args[0], "Strands must be of equal length.")
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_bytes_distance_stops_past_threshold(self):
+        strand_a = b"A" * 100
+        strand_b = b"T" * 100
+        self.assertEqual(bytes_distance(strand_a, strand_b, threshold=5, block_size=10), 10)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_one_to_many_distances(self):
+        self.assertEqual(distances(b"GGACTG", [b"GGACTG", b"GGACTA", b"AATGAA"]), [0, 1, 6])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_all_pairs_distance_matrix(self):
+        self.assertEqual(
+            distance_matrix([b"GGA", b"GGT", b"TTT"]).tolist(),
+            [[0, 1, 3], [1, 0, 2], [3, 2, 0]],
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_distance_matrix_matches_pairwise_distances(self):
+        reads = [bytes(b"ACGT"[(row * column) % 4] for column in range(40)) for row in range(9)]
+        expected = [[bytes_distance(a, b) for b in reads] for a in reads]
+        self.assertEqual(distance_matrix(reads, block_size=16).tolist(), expected)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_distance_matrix_stops_past_threshold(self):
+        matrix = distance_matrix([b"A" * 100, b"T" * 100, b"G" * 100], threshold=5, block_size=10)
+        self.assertEqual(matrix.tolist(), [[0, 10, 10], [10, 0, 10], [10, 10, 0]])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_distance_matrix_disallows_different_lengths(self):
+        with self.assertRaises(ValueError) as err:
+            distance_matrix([b"AATG", b"AAA"])
+        self.assertEqual(err.exception.args[0], "Strands must be of equal length.")
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_memory_mapped_strands(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "strand.txt")
+            with open(path, "wb") as strand_file:
+                strand_file.write(b"GGACGGATTCTG")
+            strand = map_strand(path)
+            try:
+                self.assertEqual(bytes_distance(strand, b"AGGACGGATTCT"), 9)
+            finally:
+                strand.close()
@@ -1,17 +1,159 @@
 """Functions to keep track and alter inventory."""
 
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import MutableMapping
+from itertools import repeat
+
+# Batches with at least this many distinct items update the counts with NumPy.
+BULK_SIZE = 1 << 12
+
+
+class Inventory(MutableMapping):
+    """An inventory that stores item counts in a compact integer array.
+
+    Item names are interned to integer ids (in insertion order, like dict keys),
+    counts live in an `array('q')` indexed by id, and the ids with a positive
+    count are kept in a sorted list as they change, so listing available items
+    never scans or sorts the whole inventory. Deleted items leave their slot
+    behind until more than half the slots are dead, at which point the ids are
+    renumbered. It compares equal to a dict with the same counts.
+    """
+
+    def __init__(self, items=()):
+        self._ids = {}
+        self._names = []
+        self._counts = array('q')
+        self._positive = []
+        self.add_many(items)
+
+    @classmethod
+    def from_counts(cls, counts):
+        """Build an inventory from an existing item -> count mapping."""
+
+        inventory = cls()
+        for item, count in counts.items():
+            inventory[item] = count
+        return inventory
+
+    def _intern(self, item):
+        item_id = self._ids.get(item)
+        if item_id is None:
+            item_id = self._ids[item] = len(self._names)
+            self._names.append(item)
+            self._counts.append(0)
+        return item_id
+
+    def _store(self, item_id, count):
+        was_positive = self._counts[item_id] > 0
+        self._counts[item_id] = count
+        if count > 0 and not was_positive:
+            insort(self._positive, item_id)
+        elif count <= 0 and was_positive:
+            del self._positive[bisect_left(self._positive, item_id)]
+
+    def _compact(self):
+        """Renumber the live items 0..n-1 in insertion order, dropping deleted slots."""
+
+        counts = self._counts
+        live = list(self._ids.items())
+        self._ids = {item: item_id for item_id, (item, _) in enumerate(live)}
+        self._names = [item for item, _ in live]
+        self._counts = array('q', [counts[item_id] for _, item_id in live])
+        self._positive = [item_id for item_id, count in enumerate(self._counts) if count > 0]
+
+    def add_many(self, items):
+        """Increment the count of every element of `items`, once per occurrence."""
+
+        tally = Counter(items)
+        if len(tally) >= BULK_SIZE:
+            for item in tally:
+                self._intern(item)
+            self._bulk_update(map(self._ids.__getitem__, tally), tally.values(), len(tally), 1)
+            return
+        for item, amount in tally.items():
+            item_id = self._intern(item)
+            self._store(item_id, self._counts[item_id] + amount)
+
+    def decrement_many(self, items):
+        """Decrement the count of every known element of `items`, never below zero."""
+
+        tally = Counter(items)
+        if len(tally) >= BULK_SIZE:
+            self._bulk_update(map(self._ids.get, tally, repeat(-1)), tally.values(), len(tally), -1)
+            return
+        for item, amount in tally.items():
+            item_id = self._ids.get(item)
+            if item_id is not None:
+                self._store(item_id, max(0, self._counts[item_id] - amount))
+
+    def _bulk_update(self, item_ids, amounts, size, sign):
+        """Add `sign` times each amount to the count of the matching distinct id.
+
+        The ids and amounts become NumPy arrays and are applied to a view of the
+        counts buffer in one step; unknown ids (-1) are skipped and decrements
+        stop at zero. Callers still tally with a Counter: mapping every single
+        occurrence to its id for `np.bincount` costs as much as the tally itself.
+        """
+
+        import numpy as np
+
+        item_ids = np.fromiter(item_ids, dtype=np.intp, count=size)
+        amounts = np.fromiter(amounts, dtype=np.int64, count=size)
+        known = item_ids >= 0
+        item_ids, amounts = item_ids[known], amounts[known]
+        counts = np.frombuffer(self._counts, dtype=np.int64)
+        was_positive = counts[item_ids] > 0
+        if sign > 0:
+            counts[item_ids] += amounts
+        else:
+            counts[item_ids] = np.maximum(counts[item_ids] - amounts, 0)
+        is_positive = counts[item_ids] > 0
+        del counts  # release the buffer so the array can grow again
+
+        for item_id in np.sort(item_ids[is_positive & ~was_positive]).tolist():
+            insort(self._positive, item_id)
+        dropped = set(item_ids[was_positive & ~is_positive].tolist())
+        if dropped:
+            self._positive = [item_id for item_id in self._positive if item_id not in dropped]
+
+    def available(self):
+        """List (item, count) pairs with a positive count, in insertion order."""
+
+        return [(self._names[item_id], self._counts[item_id]) for item_id in self._positive]
+
+    def __getitem__(self, item):
+        return self._counts[self._ids[item]]
+
+    def __setitem__(self, item, count):
+        self._store(self._intern(item), count)
+
+    def __delitem__(self, item):
+        item_id = self._ids.pop(item)
+        self._names[item_id] = None
+        self._store(item_id, 0)
+        if len(self._names) > 2 * len(self._ids):
+            self._compact()
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
 
 def create_inventory(items):
-    """Create a dict that tracks the amount (count) of each element on the `items` list.
+    """Create an inventory that tracks the amount (count) of each element on the `items` list.
 
     :param items: list - list of items to create an inventory from.
-    :return: dict - the inventory dictionary.
+    :return: Inventory - the inventory, which behaves like (and compares equal to) a dict.
     """
 
-    inventory = {}
-    for item in items:
-        inventory[item] = inventory.get(item, 0) + 1
-    return inventory
+    return Inventory(items)
 
 
 def add_items(inventory, items):
@@ -22,6 +164,9 @@ def add_items(inventory, items):
     :return: dict - the inventory updated with the new items.
     """
 
+    if isinstance(inventory, Inventory):
+        inventory.add_many(items)
+        return inventory
     for item in items:
         inventory[item] = inventory.get(item, 0) + 1
     return inventory
@@ -35,6 +180,9 @@ def decrement_items(inventory, items):
     :return: dict - updated inventory with items decremented.
     """
 
+    if isinstance(inventory, Inventory):
+        inventory.decrement_many(items)
+        return inventory
     for item in items:
         if item in inventory:
             inventory[item] = max(0, inventory[item] - 1)
@@ -61,5 +209,7 @@ def list_inventory(inventory):
     :return: list of tuples - list of key, value pairs from the inventory dictionary.
     """
 
+    if isinstance(inventory, Inventory):
+        return inventory.available()
     return [(item, count) for item, count in inventory.items() if count > 0]
 
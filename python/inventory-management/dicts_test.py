@@ -1,6 +1,9 @@
+import importlib.util
 import unittest
 import pytest
-from dicts import (create_inventory,
+from dicts import (BULK_SIZE,
+                   Inventory,
+                   create_inventory,
                    add_items,
                    decrement_items,
                    remove_item,
@@ -118,3 +121,45 @@ class InventoryTest(unittest.TestCase):
                          f'but the tests expected {expected}.')
 
         self.assertEqual(actual_result, expected, msg=error_message)
+
+    def test_inventory_functions_on_an_inventory(self):
+        inventory = create_inventory(["coal", "wood", "wood", "diamond"])
+        add_items(inventory, ["iron", "coal", "coal"])
+        decrement_items(inventory, ["diamond", "diamond", "wood", "gold"])
+        remove_item(inventory, "iron")
+
+        self.assertIsInstance(inventory, Inventory)
+        self.assertEqual(inventory, {"coal": 3, "wood": 1, "diamond": 0})
+        self.assertEqual(list_inventory(inventory), [("coal", 3), ("wood", 1)])
+
+    def test_inventory_keeps_insertion_order_after_re_adding(self):
+        inventory = Inventory.from_counts({"coal": 1, "wood": 2})
+        del inventory["coal"]
+        inventory.add_many(["coal"])
+
+        self.assertEqual(list(inventory), ["wood", "coal"])
+        self.assertEqual(inventory.available(), [("wood", 2), ("coal", 1)])
+
+    def test_inventory_reuses_space_under_delete_and_re_add(self):
+        inventory = Inventory(["coal", "wood", "iron"])
+        for _ in range(1000):
+            del inventory["wood"]
+            inventory.add_many(["wood"])
+
+        self.assertLessEqual(len(inventory._counts), 2 * len(inventory))
+        self.assertEqual(list(inventory), ["coal", "iron", "wood"])
+        self.assertEqual(inventory.available(), [("coal", 1), ("iron", 1), ("wood", 1)])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_inventory_bulk_updates_match_a_dict(self):
+        items = [f"item{index % (BULK_SIZE + 7)}" for index in range(3 * BULK_SIZE)]
+        inventory = Inventory(["coal", "item3"])
+        inventory["item5"] = -2
+        expected = {"coal": 1, "item3": 1, "item5": -2}
+        add_items(inventory, items)
+        add_items(expected, items)
+        decrement_items(inventory, items[:2 * BULK_SIZE] + ["gold"] * BULK_SIZE)
+        decrement_items(expected, items[:2 * BULK_SIZE] + ["gold"] * BULK_SIZE)
+
+        self.assertEqual(list(inventory.items()), list(expected.items()))
+        self.assertEqual(list_inventory(inventory), list_inventory(expected))
@@ -1,26 +1,122 @@
-def is_valid(isbn):
+import csv
+from itertools import accumulate, islice
+
+VALID = "valid"
+BAD_LENGTH = "length"
+BAD_CHARACTER = "character"
+BAD_CHECKSUM = "checksum"
+
+DIGITS = "0123456789"
+# Maps the ASCII digits of an encoded ISBN to their numeric values.
+DIGIT_VALUES = bytes.maketrans(DIGITS.encode(), bytes(range(10)))
+
+CHUNK_SIZE = 1 << 16
+# Result for each reason code produced by `_check_chunk`.
+RESULTS = ((True, VALID), (False, BAD_LENGTH), (False, BAD_CHARACTER), (False, BAD_CHECKSUM))
+
+
+def check(isbn):
     """
-    Check if a string is a valid ISBN-10.
+    Check an ISBN-10 and return a (valid, reason) pair.
+
+    The weighted sum 10*d1 + 9*d2 + ... + 2*d9 equals the sum of the running
+    totals of d1..d9 plus their plain sum, so it is computed without a
+    Python-level loop over the characters.
     """
     # Remove hyphens and check length
     isbn = isbn.replace("-", "")
     if len(isbn) != 10:
-        return False
-
-    # Validate characters and calculate sum
-    total = 0
-    for i, char in enumerate(isbn):
-        if i < 9:
-            if not char.isdigit():
-                return False
-            total += int(char) * (10 - i)
-        else:  # Check digit
-            if char == "X":
-                total += 10
-            elif not char.isdigit():
-                return False
-            else:
-                total += int(char)
+        return False, BAD_LENGTH
+
+    body, check_digit = isbn[:9], isbn[9]
+    if not (body.isascii() and body.isdigit()):
+        return False, BAD_CHARACTER
+    if check_digit == "X":
+        total = 10
+    elif check_digit in DIGITS:
+        total = int(check_digit)
+    else:
+        return False, BAD_CHARACTER
+
+    values = body.encode().translate(DIGIT_VALUES)
+    total += sum(accumulate(values)) + sum(values)
 
     # Check if the sum is divisible by 11
-    return total % 11 == 0
\ No newline at end of file
+    if total % 11:
+        return False, BAD_CHECKSUM
+    return True, VALID
+
+
+def is_valid(isbn):
+    """
+    Check if a string is a valid ISBN-10.
+    """
+    return check(isbn)[0]
+
+
+def _check_chunk(np, isbns):
+    """
+    Return the reason code (an index into RESULTS) of every ISBN in a list.
+
+    The ISBNs of length 10 are packed into one (rows, 10) uint8 array, so the
+    character checks and weighted checksums run as NumPy operations on the
+    whole chunk. Non-ASCII characters become "?" and so fail the digit check,
+    just as they do in `check`.
+    """
+    isbns = [isbn.replace("-", "") for isbn in isbns]
+    codes = np.ones(len(isbns), dtype=np.int8)  # BAD_LENGTH unless length 10
+    rows = np.flatnonzero(np.fromiter(map(len, isbns), dtype=np.int64, count=len(isbns)) == 10)
+    if not len(rows):
+        return codes
+
+    packed = "".join([isbns[row] for row in rows.tolist()]).encode("ascii", "replace")
+    chars = np.frombuffer(packed, dtype=np.uint8).reshape(-1, 10)
+    body = chars[:, :9] - ord("0")  # wraps to >9 for anything below "0"
+    check_digit = chars[:, 9]
+    is_x = check_digit == ord("X")
+    check_value = np.where(is_x, 10, check_digit - ord("0"))
+
+    characters_ok = (body <= 9).all(axis=1) & (is_x | (check_value <= 9))
+    totals = body.astype(np.int64) @ np.arange(10, 1, -1) + check_value
+    codes[rows] = np.where(characters_ok, np.where(totals % 11 == 0, 0, 3), 2)
+    return codes
+
+
+def validate_many(isbns, chunk_size=CHUNK_SIZE):
+    """
+    Yield a (valid, reason) pair for every ISBN in an iterable.
+
+    ISBNs are read `chunk_size` at a time and checked in bulk with NumPy;
+    the results are identical to calling `check` on each one.
+    """
+    import numpy as np
+
+    isbns = iter(isbns)
+    while True:
+        chunk = list(islice(isbns, chunk_size))
+        if not chunk:
+            return
+        for code in _check_chunk(np, chunk).tolist():
+            yield RESULTS[code]
+
+
+def validate_file(path, column=None):
+    """
+    Yield a (valid, reason) pair for every row of a file.
+
+    Rows are newline-delimited ISBNs, or with `column` (an index) the named
+    field of each CSV record. A blank or short record counts as an empty ISBN,
+    so it yields (False, BAD_LENGTH).
+    """
+    with open(path, newline="", encoding="utf-8") as rows:
+        if column is None:
+            yield from validate_many(row.rstrip("\r\n") for row in rows)
+        else:
+            yield from validate_many(_field(record, column) for record in csv.reader(rows))
+
+
+def _field(record, column):
+    try:
+        return record[column]
+    except IndexError:
+        return ""
@@ -2,10 +2,16 @@
 # https://github.com/exercism/problem-specifications/tree/main/exercises/isbn-verifier/canonical-data.json
 # File last updated on 2023-07-19
 
+import importlib.util
+import os
+import tempfile
 import unittest
 
 from isbn_verifier import (
+    check,
     is_valid,
+    validate_file,
+    validate_many,
 )
 
 
@@ -66,3 +72,52 @@ class IsbnVerifierTest(unittest.TestCase):
 
     def test_input_is_too_long_but_contains_a_valid_isbn(self):
         self.assertIs(is_valid("98245726788"), False)
+
+    # Additional tests for this track
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_validate_many_reports_reasons(self):
+        self.assertEqual(
+            list(validate_many(["3-598-21508-8", "3-598-21508-9", "3-598-2X507-9", "359821507"])),
+            [(True, "valid"), (False, "checksum"), (False, "character"), (False, "length")],
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_validate_file_of_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "isbns.txt")
+            with open(path, "w", encoding="utf-8") as rows:
+                rows.write("3-598-21507-X\n3598215088\n3-598-21508-9\n")
+            self.assertEqual(
+                [valid for valid, _ in validate_file(path)], [True, True, False]
+            )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_validate_file_csv_column(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "catalog.csv")
+            with open(path, "w", encoding="utf-8") as rows:
+                rows.write("Dune,3-598-21507-X\n\"Emma, a novel\",3-598-21507-A\n")
+            self.assertEqual(
+                list(validate_file(path, column=1)),
+                [(True, "valid"), (False, "character")],
+            )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_validate_file_csv_blank_and_short_rows(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "catalog.csv")
+            with open(path, "w", encoding="utf-8") as rows:
+                rows.write("Dune,3-598-21507-X\n\nEmma\n")
+            self.assertEqual(
+                list(validate_file(path, column=1)),
+                [(True, "valid"), (False, "length"), (False, "length")],
+            )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_validate_many_matches_check(self):
+        isbns = ["3-598-21508-8", "3-598-21507-X", "3-598-21507-A", "3-598-P1581-X", "3-598-2X507-9",
+                 "3598215088", "359821507X", "3-598-21507", "3598215078X", "", "134456729", "98245726788",
+                 "3-598-21515-X", "3132P34035", "3-598-2150/-X", "3-598-2150:-X", "3-598-215é7-X",
+                 "0000000000", "X000000000"]
+        self.assertEqual(list(validate_many(isbns, chunk_size=4)), [check(isbn) for isbn in isbns])
@@ -1,18 +1,74 @@
+import time
+from multiprocessing import Pool
+from string import ascii_lowercase
+
+# Deletes every ASCII character that is not a lowercase letter.
+ASCII_NON_LETTERS = str.maketrans(
+    "", "", "".join(chr(code) for code in range(128) if chr(code) not in ascii_lowercase)
+)
+
+
 def is_isogram(string):
     """
     This function checks if a string is an isogram
 
+    ASCII input is checked with a 26-bit mask; other input falls back to a set
+    of the alphabetic characters.
+
     Args:
         string(str): The string to check
 
     Returns:
         bool: True if the string is an isogram, False otherwise
     """
-    seen_letters = []
+    string = string.lower()
+
+    if string.isascii():
+        seen_letters = 0
+        for char in string.translate(ASCII_NON_LETTERS):
+            bit = 1 << (ord(char) - 97)
+            if seen_letters & bit:
+                return False
+            seen_letters |= bit
+        return True
+
+    letters = [char for char in string if char.isalpha()]
+    return len(set(letters)) == len(letters)
+
+
+def are_isograms(words, workers=None, chunksize=10000):
+    """
+    Check many words at once, spread across a pool of worker processes.
+
+    Args:
+        words(iterable): The words to check
+        workers(int): Number of processes (defaults to the CPU count)
+        chunksize(int): Number of words sent to a worker per task
+
+    Returns:
+        list: One bool per word, in input order
+    """
+    with Pool(workers) as pool:
+        return pool.map(is_isogram, words, chunksize)
+
+
+def screen_word_list(path, workers=None):
+    """
+    Find the isograms in a newline-delimited word list and time the run.
+
+    Args:
+        path(str): The word list file
+        workers(int): Number of processes (defaults to the CPU count)
+
+    Returns:
+        tuple: (list of isograms, words checked per second)
+    """
+    with open(path, encoding="utf-8") as word_file:
+        words = [line.rstrip("\n") for line in word_file]
 
-    for char in string.lower():
-        if char.isalpha() and char in seen_letters:
-            return False
-        seen_letters.append(char)
+    start = time.perf_counter()
+    results = are_isograms(words, workers)
+    elapsed = time.perf_counter() - start
 
-    return True
+    isograms = [word for word, result in zip(words, results) if result]
+    return isograms, len(words) / elapsed if elapsed else float("inf")
@@ -2,10 +2,14 @@
 # https://github.com/exercism/problem-specifications/tree/main/exercises/isogram/canonical-data.json
 # File last updated on 2023-07-19
 
+import os
+import tempfile
 import unittest
 
 from isogram import (
+    are_isograms,
     is_isogram,
+    screen_word_list,
 )
 
 
@@ -51,3 +55,26 @@ class IsogramTest(unittest.TestCase):
 
     def test_word_with_duplicated_character_and_with_two_hyphens(self):
         self.assertIs(is_isogram("up-to-date"), False)
+
+    # Additional tests for this track
+
+    def test_unicode_isogram(self):
+        self.assertIs(is_isogram("Éclairs-Du"), True)
+
+    def test_unicode_word_with_duplicated_character_in_mixed_case(self):
+        self.assertIs(is_isogram("Ééa"), False)
+
+    def test_are_isograms_in_input_order(self):
+        self.assertEqual(
+            are_isograms(["lumberjacks", "isograms", "six-year-old"], workers=2),
+            [True, False, True],
+        )
+
+    def test_screen_word_list(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "words.txt")
+            with open(path, "w", encoding="utf-8") as word_file:
+                word_file.write("background\neleven\nDermatoglyphics\n")
+            isograms, throughput = screen_word_list(path, workers=2)
+        self.assertEqual(isograms, ["background", "Dermatoglyphics"])
+        self.assertGreater(throughput, 0)
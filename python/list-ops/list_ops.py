@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+from types import SimpleNamespace
+
 def append(list1, list2):
     return list1 + list2
 
@@ -34,12 +37,49 @@ def foldl(function, list, initial):
 
 def foldr(function, list, initial):
     acc = initial
-    for item in reverse(list):
+    for item in _iter_reversed(list):
         acc = function(acc, item)
     return acc
 
 def reverse(list):
     result = []
-    for item in list:
-        result.insert(0, item)
+    for item in _iter_reversed(list):
+        result.append(item)
     return result
+
+def _iter_reversed(list):
+    # Walk a sequence backwards by index instead of building a reversed copy;
+    # any other iterable (a generator, a set, ...) is materialized first.
+    if not isinstance(list, Sequence):
+        items = []
+        for item in list:
+            items.append(item)
+        list = items
+    for index in range(length(list) - 1, -1, -1):
+        yield list[index]
+
+def _iter_append(list1, list2):
+    yield from list1
+    yield from list2
+
+def _iter_concat(lists):
+    for l in lists:
+        yield from l
+
+def _iter_filter(function, list):
+    for item in list:
+        if function(item):
+            yield item
+
+def _iter_map(function, list):
+    for item in list:
+        yield function(item)
+
+# Iterator-returning versions of the list operations, e.g. lazy.map(f, items).
+lazy = SimpleNamespace(
+    append=_iter_append,
+    concat=_iter_concat,
+    filter=_iter_filter,
+    map=_iter_map,
+    reverse=_iter_reversed,
+)
@@ -9,6 +9,7 @@ from list_ops import (
     concat,
     foldl,
     foldr,
+    lazy,
     length,
     reverse,
     filter as list_ops_filter,
@@ -100,3 +101,25 @@ class ListOpsTest(unittest.TestCase):
 
     def test_reverse_reverse_mixed_types(self):
         self.assertEqual(reverse(["xyz", 4.0, "cat", 1]), [1, "cat", 4.0, "xyz"])
+
+    def test_reverse_long_list(self):
+        self.assertEqual(reverse(list(range(100000))), list(range(99999, -1, -1)))
+
+    def test_lazy_operations_return_iterators(self):
+        mapped = lazy.map(lambda x: x * 2, [1, 2, 3])
+        self.assertEqual(next(mapped), 2)
+        self.assertEqual(list(mapped), [4, 6])
+
+    def test_lazy_operations_match_eager_operations(self):
+        self.assertEqual(list(lazy.append([1, 2], [3])), append([1, 2], [3]))
+        self.assertEqual(list(lazy.concat([[1], [2, [3]]])), concat([[1], [2, [3]]]))
+        self.assertEqual(
+            list(lazy.filter(lambda x: x % 2, [1, 2, 3])),
+            list_ops_filter(lambda x: x % 2, [1, 2, 3]),
+        )
+        self.assertEqual(list(lazy.reverse([[1, 2], [3]])), reverse([[1, 2], [3]]))
+
+    def test_reverse_and_foldr_accept_any_iterable(self):
+        self.assertEqual(reverse(x for x in [1, 2, 3]), [3, 2, 1])
+        self.assertEqual(list(lazy.reverse(iter("abc"))), ["c", "b", "a"])
+        self.assertEqual(foldr(lambda acc, el: acc + el, (c for c in "abc"), "!"), "!cba")
@@ -1,12 +1,64 @@
-def is_paired(input_string):
-    brackets = {"[": "]", "{": "}", "(": ")"}
-    stack = []
+import re
+
+OPENING = "([{"
+CLOSING = ")]}"
+MATCHING = dict(zip(CLOSING, OPENING))
+BRACKET_PATTERN = re.compile(r"[()\[\]{}]")
+
+
+class BracketValidator:
+    """
+    Check bracket pairing over input that arrives in chunks.
+
+    Only bracket characters are visited in Python; everything else is skipped
+    by the precompiled pattern. `error_position` is the absolute offset of the
+    first unmatched closing bracket, or None.
+    """
+
+    def __init__(self):
+        self._stack = []
+        self.offset = 0
+        self.error_position = None
 
-    for char in input_string:
-        if char in brackets.keys():
-            stack.append(char)
-        elif char in brackets.values():
-            if not stack or brackets[stack.pop()] != char:
-                return False
+    @property
+    def depth(self):
+        return len(self._stack)
 
-    return not stack
+    def feed(self, chunk):
+        """
+        Validate the next chunk; return False once an error has been found.
+        """
+        if self.error_position is None:
+            stack = self._stack
+            for match in BRACKET_PATTERN.finditer(chunk):
+                char = match.group()
+                if char in MATCHING:
+                    if not stack or stack.pop() != MATCHING[char]:
+                        self.error_position = self.offset + match.start()
+                        break
+                else:
+                    stack.append(char)
+        self.offset += len(chunk)
+        return self.error_position is None
+
+    def is_paired(self):
+        return self.error_position is None and not self._stack
+
+    def snapshot(self):
+        """
+        Capture the validator state as a plain tuple.
+        """
+        return ("".join(self._stack), self.offset, self.error_position)
+
+    def restore(self, state):
+        """
+        Resume from a state previously returned by `snapshot`.
+        """
+        stack, self.offset, self.error_position = state
+        self._stack = list(stack)
+
+
+def is_paired(input_string):
+    validator = BracketValidator()
+    validator.feed(input_string)
+    return validator.is_paired()
@@ -5,6 +5,7 @@
 import unittest
 
 from matching_brackets import (
+    BracketValidator,
     is_paired,
 )
 
@@ -74,3 +75,38 @@ class MatchingBracketsTest(unittest.TestCase):
             ),
             True,
         )
+
+    # Additional tests for this track
+
+    def test_validator_across_chunks(self):
+        validator = BracketValidator()
+        for chunk in ("{ [(", "x) ]", " }"):
+            self.assertTrue(validator.feed(chunk))
+        self.assertEqual(validator.depth, 0)
+        self.assertTrue(validator.is_paired())
+
+    def test_validator_reports_depth_of_open_brackets(self):
+        validator = BracketValidator()
+        validator.feed("{[(")
+        self.assertEqual(validator.depth, 3)
+        self.assertFalse(validator.is_paired())
+
+    def test_validator_reports_first_error_position(self):
+        validator = BracketValidator()
+        validator.feed("(ab")
+        self.assertFalse(validator.feed("c]d)"))
+        self.assertEqual(validator.error_position, 4)
+        self.assertFalse(validator.feed("()"))
+        self.assertEqual(validator.error_position, 4)
+
+    def test_validator_snapshot_and_restore(self):
+        validator = BracketValidator()
+        validator.feed("{[")
+        state = validator.snapshot()
+        validator.feed("}")
+        self.assertFalse(validator.is_paired())
+
+        resumed = BracketValidator()
+        resumed.restore(state)
+        resumed.feed("]}")
+        self.assertTrue(resumed.is_paired())
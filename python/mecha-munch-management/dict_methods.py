@@ -1,5 +1,115 @@
 """Functions to manage a users shopping cart items."""
 
+from array import array
+from collections import Counter, namedtuple
+from collections.abc import Mapping
+
+FulfillmentRecord = namedtuple('FulfillmentRecord', ['item', 'quantity', 'aisle', 'refrigeration'])
+
+
+def _aisle_key(aisle):
+    """Sort key that orders "Aisle 2" before "Aisle 10"."""
+
+    prefix, _, number = aisle.rpartition(' ')
+    if number.isdigit():
+        return (prefix, int(number), '')
+    return (aisle, -1, aisle)
+
+
+class AisleIndex(Mapping):
+    """An aisle table indexed once for picking order.
+
+    It is a read-only item -> [aisle, refrigeration] mapping, so it can be passed
+    anywhere an aisle mapping is expected, and it also knows each item's aisle
+    rank ("Aisle 2" before "Aisle 10"). Build it once and share it between batches.
+    """
+
+    def __init__(self, aisle_mapping):
+        self._mapping = dict(aisle_mapping)
+        aisles = sorted({aisle for aisle, _ in self._mapping.values()}, key=_aisle_key)
+        rank_of = {aisle: rank for rank, aisle in enumerate(aisles)}
+        self._ranks = {item: rank_of[aisle] for item, (aisle, _) in self._mapping.items()}
+
+    def rank(self, item):
+        """Return the picking-order rank of `item`'s aisle (KeyError if it has none)."""
+
+        return self._ranks[item]
+
+    def __getitem__(self, item):
+        return self._mapping[item]
+
+    def __iter__(self):
+        return iter(self._mapping)
+
+    def __len__(self):
+        return len(self._mapping)
+
+
+class CartBatch:
+    """Aggregate many shopping carts into one set of item counts.
+
+    Item names are interned to integer ids (in first-seen order) and quantities
+    live in an `array('q')` indexed by id. Fulfillment joins the ordered items
+    against an `AisleIndex` built once by the caller, so emitting records is one
+    sort of (rank, item) pairs over the ordered items only.
+    """
+
+    def __init__(self, aisle_index=None):
+        if aisle_index is not None and not isinstance(aisle_index, AisleIndex):
+            aisle_index = AisleIndex(aisle_index)
+        self.aisle_index = aisle_index
+        self._ids = {}
+        self._names = []
+        self._counts = array('q')
+
+    def _intern(self, item):
+        item_id = self._ids.get(item)
+        if item_id is None:
+            item_id = self._ids[item] = len(self._names)
+            self._names.append(item)
+            self._counts.append(0)
+        return item_id
+
+    def add_items(self, items):
+        """Add one of every element of `items`, once per occurrence (like `add_item`)."""
+
+        self.add_cart(Counter(items))
+        return self
+
+    def add_cart(self, cart):
+        """Add the quantities of an item -> quantity cart (zero quantities are kept)."""
+
+        counts = self._counts
+        for item, quantity in cart.items():
+            counts[self._intern(item)] += quantity
+        return self
+
+    def add_carts(self, carts):
+        """Add every item -> quantity cart in `carts`."""
+
+        for cart in carts:
+            self.add_cart(cart)
+        return self
+
+    def counts(self):
+        """Return the ordered items as an item -> quantity dict, in first-seen order."""
+
+        return dict(zip(self._names, self._counts))
+
+    def fulfillment(self):
+        """List a FulfillmentRecord per ordered item, in aisle (picking) order.
+
+        Items in the same aisle are listed alphabetically. An ordered item
+        missing from the aisle index raises KeyError, and a batch built
+        without an aisle index raises ValueError.
+        """
+
+        index = self.aisle_index
+        if index is None:
+            raise ValueError('CartBatch needs an aisle_index to list fulfillment records')
+        ordered = sorted((index.rank(item), item, count) for item, count in zip(self._names, self._counts))
+        return [FulfillmentRecord(item, count, *index[item]) for _, item, count in ordered]
+
 
 def add_item(current_cart, items_to_add):
     """Add items to shopping cart.
@@ -50,8 +160,12 @@ def send_to_store(cart, aisle_mapping):
     """Combine users order to aisle and refrigeration information.
 
     :param cart: dict - users shopping cart dictionary.
-    :param aisle_mapping: dict - aisle and refrigeration information dictionary.
+    :param aisle_mapping: dict - aisle and refrigeration information dictionary (or an `AisleIndex`).
     :return: dict - fulfillment dictionary ready to send to store.
+
+    A single cart is joined directly rather than through a `CartBatch`: it is one
+    pass over the cart either way, and a batch would also intern every item and
+    sort by aisle rank, while this dict is ordered reverse-alphabetically.
     """
 
     fulfillment_cart = {}
@@ -2,6 +2,9 @@ import unittest
 import pytest
 from collections import OrderedDict
 from dict_methods import (
+    AisleIndex,
+    CartBatch,
+    FulfillmentRecord,
     add_item,
     read_notes,
     update_recipes,
@@ -92,3 +95,50 @@ class MechaMunchManagementTest(unittest.TestCase):
                              f'expected: {expected} as the store inventory.')
 
                 self.assertEqual(actual_result, expected, msg=error_msg)
+
+    def test_cart_batch_aggregates_carts(self):
+        batch = CartBatch()
+        batch.add_carts([{"Apple": 2, "Milk": 1}, {"Milk": 3}])
+        batch.add_items(["Kiwi", "Apple", "Kiwi"])
+
+        self.assertEqual(batch.counts(), {"Apple": 3, "Milk": 4, "Kiwi": 2})
+
+    def test_cart_batch_fulfillment_in_aisle_order(self):
+        aisle_mapping = {
+            "Banana": ["Aisle 10", False],
+            "Apple": ["Aisle 4", False],
+            "Orange": ["Aisle 4", False],
+            "Milk": ["Aisle 2", True],
+            "Kiwi": ["Aisle 6", False],
+        }
+        batch = CartBatch(AisleIndex(aisle_mapping))
+        batch.add_carts([{"Orange": 1, "Banana": 3}, {"Milk": 2, "Apple": 2, "Orange": 1}])
+
+        self.assertEqual(batch.fulfillment(), [
+            FulfillmentRecord("Milk", 2, "Aisle 2", True),
+            FulfillmentRecord("Apple", 2, "Aisle 4", False),
+            FulfillmentRecord("Orange", 2, "Aisle 4", False),
+            FulfillmentRecord("Banana", 3, "Aisle 10", False),
+        ])
+
+    def test_cart_batch_fulfillment_unknown_item(self):
+        batch = CartBatch({"Apple": ["Aisle 4", False]}).add_items(["Apple", "Durian"])
+
+        with self.assertRaises(KeyError):
+            batch.fulfillment()
+
+    def test_cart_batch_fulfillment_without_aisle_index(self):
+        batch = CartBatch().add_items(["Apple"])
+
+        with self.assertRaises(ValueError) as err:
+            batch.fulfillment()
+        self.assertEqual(err.exception.args[0], "CartBatch needs an aisle_index to list fulfillment records")
+
+    def test_cart_batch_keeps_zero_quantities(self):
+        aisle_index = AisleIndex({"Apple": ["Aisle 4", False], "Milk": ["Aisle 2", True]})
+        batch = CartBatch(aisle_index).add_cart({"Apple": 0, "Milk": 1})
+
+        self.assertEqual(batch.fulfillment(), [FulfillmentRecord("Milk", 1, "Aisle 2", True),
+                                               FulfillmentRecord("Apple", 0, "Aisle 4", False)])
+        self.assertEqual(send_to_store({"Apple": 0, "Milk": 1}, aisle_index),
+                         {"Milk": [1, "Aisle 2", True], "Apple": [0, "Aisle 4", False]})
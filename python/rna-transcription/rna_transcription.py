@@ -1,11 +1,53 @@
+DNA_NUCLEOTIDES = "GCTA"
+RNA_NUCLEOTIDES = "CGAU"
+
+TEXT_TABLE = str.maketrans(DNA_NUCLEOTIDES, RNA_NUCLEOTIDES)
+BYTES_TABLE = bytes.maketrans(DNA_NUCLEOTIDES.encode(), RNA_NUCLEOTIDES.encode())
+TEXT_NUCLEOTIDES = str.maketrans("", "", DNA_NUCLEOTIDES)
+BYTES_NUCLEOTIDES = DNA_NUCLEOTIDES.encode()
+
+
+def _check_strand(dna_strand, offset=0):
+    """
+    Raise KeyError for the first invalid nucleotide, reporting its offset.
+    """
+    if isinstance(dna_strand, str):
+        invalid = dna_strand.translate(TEXT_NUCLEOTIDES)
+    else:
+        invalid = dna_strand.translate(None, BYTES_NUCLEOTIDES)
+    if invalid:
+        bad_base = invalid[:1]
+        position = offset + dna_strand.index(bad_base)
+        if not isinstance(bad_base, str):
+            bad_base = bad_base.decode("latin-1")
+        raise KeyError(f"Invalid nucleotide {bad_base!r} at offset {position}")
+
+
+def _transcribe(dna_strand, offset=0):
+    _check_strand(dna_strand, offset)
+    if isinstance(dna_strand, str):
+        return dna_strand.translate(TEXT_TABLE)
+    return dna_strand.translate(BYTES_TABLE)
+
+
 def to_rna(dna_strand):
-    transcription_map = {
-        'G': 'C',
-        'C': 'G',
-        'T': 'A',
-        'A': 'U'
-    }
-    rna_strand = ""
-    for nucleotide in dna_strand:
-        rna_strand += transcription_map[nucleotide]
-    return rna_strand
\ No newline at end of file
+    """
+    Transcribe a DNA strand (str or bytes) into its RNA complement.
+    """
+    return _transcribe(dna_strand)
+
+
+def to_rna_stream(readable, chunk_size=1 << 16):
+    """
+    Transcribe a DNA strand read from a file-like object, chunk by chunk.
+
+    Yields RNA chunks of the same type (str or bytes) the readable returns,
+    so memory use is bounded by `chunk_size` regardless of strand length.
+    """
+    offset = 0
+    while True:
+        chunk = readable.read(chunk_size)
+        if not chunk:
+            return
+        yield _transcribe(chunk, offset)
+        offset += len(chunk)
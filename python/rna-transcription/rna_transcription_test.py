@@ -2,10 +2,12 @@
 # https://github.com/exercism/problem-specifications/tree/main/exercises/rna-transcription/canonical-data.json
 # File last updated on 2023-07-19
 
+import io
 import unittest
 
 from rna_transcription import (
     to_rna,
+    to_rna_stream,
 )
 
 
@@ -27,3 +29,28 @@ class RnaTranscriptionTest(unittest.TestCase):
 
     def test_rna_complement(self):
         self.assertEqual(to_rna("ACGTGGTCTTAA"), "UGCACCAGAAUU")
+
+    # Additional tests for this track
+
+    def test_rna_complement_of_bytes(self):
+        self.assertEqual(to_rna(b"ACGTGGTCTTAA"), b"UGCACCAGAAUU")
+
+    def test_invalid_nucleotide_reports_offset(self):
+        with self.assertRaises(KeyError) as err:
+            to_rna("ACGXT")
+        self.assertIn("offset 3", str(err.exception))
+
+    def test_stream_matches_to_rna(self):
+        strand = "ACGTGGTCTTAA" * 100
+        chunks = to_rna_stream(io.StringIO(strand), chunk_size=7)
+        self.assertEqual("".join(chunks), to_rna(strand))
+
+    def test_stream_of_bytes(self):
+        chunks = to_rna_stream(io.BytesIO(b"ACGTGGTCTTAA"), chunk_size=5)
+        self.assertEqual(b"".join(chunks), b"UGCACCAGAAUU")
+
+    def test_stream_invalid_nucleotide_reports_absolute_offset(self):
+        chunks = to_rna_stream(io.StringIO("ACGTACGTAN"), chunk_size=4)
+        with self.assertRaises(KeyError) as err:
+            list(chunks)
+        self.assertIn("offset 9", str(err.exception))
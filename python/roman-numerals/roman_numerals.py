@@ -1,15 +1,104 @@
-def roman(number):
-    roman_map = [
-        (1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'),
-        (100, 'C'), (90, 'XC'), (50, 'L'), (40, 'XL'),
-        (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'),
-        (1, 'I')
-    ]
+from functools import lru_cache
+
+ROMAN_MAP = [
+    (1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'),
+    (100, 'C'), (90, 'XC'), (50, 'L'), (40, 'XL'),
+    (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'),
+    (1, 'I')
+]
+SYMBOL_VALUES = {'M': 1000, 'D': 500, 'C': 100, 'L': 50, 'X': 10, 'V': 5, 'I': 1}
+MAX_TABLE_NUMBER = 3999
+
+_roman_table = None
 
+
+def _roman_by_loop(number):
     result = ''
-    for arabic, roman_symbol in roman_map:
+    for arabic, roman_symbol in ROMAN_MAP:
         while number >= arabic:
             result += roman_symbol
             number -= arabic
     return result
 
+
+_roman_cached = lru_cache(maxsize=None)(_roman_by_loop)
+
+
+def roman_table():
+    """Return the list of numerals for 0-3999, building it on first use.
+
+    Each numeral is the concatenation of its thousands, hundreds, tens and
+    ones parts, so the whole table takes 4000 joins of four short strings.
+    """
+    global _roman_table
+    if _roman_table is None:
+        ones = [_roman_by_loop(digit) for digit in range(10)]
+        tens = [_roman_by_loop(digit * 10) for digit in range(10)]
+        hundreds = [_roman_by_loop(digit * 100) for digit in range(10)]
+        thousands = [_roman_by_loop(digit * 1000) for digit in range(4)]
+        _roman_table = [
+            thousands[number // 1000] + hundreds[number // 100 % 10]
+            + tens[number // 10 % 10] + ones[number % 10]
+            for number in range(MAX_TABLE_NUMBER + 1)
+        ]
+    return _roman_table
+
+
+def roman(number):
+    if 0 <= number <= MAX_TABLE_NUMBER:
+        return roman_table()[number]
+    return _roman_by_loop(number)
+
+
+def roman_many(numbers):
+    """Convert every number in an iterable, returning a list of numerals."""
+    table = roman_table()
+    return [table[number] if 0 <= number <= MAX_TABLE_NUMBER else _roman_by_loop(number)
+            for number in numbers]
+
+
+def from_roman(numeral):
+    """Parse a numeral in one pass, without regular expressions.
+
+    A symbol smaller than the one after it is subtracted (the IV, XC, ...
+    forms). Numerals that are not in canonical form raise ValueError.
+    """
+    total = 0
+    previous = 0
+    for symbol in reversed(numeral):
+        try:
+            value = SYMBOL_VALUES[symbol]
+        except KeyError:
+            raise ValueError(f"invalid roman numeral: {numeral!r}") from None
+        if value < previous:
+            total -= value
+        else:
+            total += value
+            previous = value
+
+    if not numeral or roman(total) != numeral:
+        raise ValueError(f"invalid roman numeral: {numeral!r}")
+    return total
+
+
+def benchmark(repeat=5):
+    """Time converting 1-3999 with the table, the per-call loop and an lru_cache."""
+    from timeit import timeit
+
+    numbers = range(1, MAX_TABLE_NUMBER + 1)
+    roman_table()
+    for number in numbers:
+        _roman_cached(number)
+
+    approaches = [
+        ('table', lambda: roman_many(numbers)),
+        ('loop', lambda: [_roman_by_loop(number) for number in numbers]),
+        ('lru_cache', lambda: [_roman_cached(number) for number in numbers]),
+    ]
+    return {name: min(timeit(run, number=1) for _ in range(repeat))
+            for name, run in approaches}
+
+
+if __name__ == '__main__':
+    for name, seconds in benchmark().items():
+        print(f'{name:>10}: {seconds * 1e6:9.1f} us for 1-{MAX_TABLE_NUMBER}')
@@ -5,7 +5,9 @@
 import unittest
 
 from roman_numerals import (
+    from_roman,
     roman,
+    roman_many,
 )
 
 
@@ -90,3 +92,18 @@ class RomanNumeralsTest(unittest.TestCase):
 
     def test_3999_is_mmmcmxcix(self):
         self.assertEqual(roman(3999), "MMMCMXCIX")
+
+    # Additional tests for this track
+
+    def test_roman_many(self):
+        self.assertEqual(roman_many([1, 4, 1994, 3999]), ["I", "IV", "MCMXCIV", "MMMCMXCIX"])
+
+    def test_from_roman_round_trips(self):
+        for number in range(1, 4000):
+            self.assertEqual(from_roman(roman(number)), number)
+
+    def test_from_roman_rejects_non_canonical_numerals(self):
+        for numeral in ("", "IIII", "IC", "VX", "MCMC", "ABC"):
+            with self.subTest(numeral=numeral):
+                with self.assertRaises(ValueError):
+                    from_roman(numeral)
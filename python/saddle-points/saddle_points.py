@@ -1,24 +1,56 @@
+def _check_regular(matrix):
+    num_cols = len(matrix[0])
+    for row in matrix:
+        if len(row) != num_cols:
+            raise ValueError("irregular matrix")
+
+
 def saddle_points(matrix):
     if not matrix:
         return []
 
-    num_rows = len(matrix)
-    num_cols = len(matrix[0])
-
     # Check for irregular matrix
-    for row in matrix:
-        if len(row) != num_cols:
-            raise ValueError("irregular matrix")
+    _check_regular(matrix)
+    if not matrix[0]:
+        return []
+
+    # Every saddle point (r, c) satisfies row_max[r] == column_min[c], and
+    # since max(column_min) <= min(row_max) they all share a single value.
+    row_maxima = [max(row) for row in matrix]
+    column_minima = [min(column) for column in zip(*matrix)]
+    value = min(row_maxima)
+    if max(column_minima) != value:
+        return []
+
+    rows = [r for r, row_max in enumerate(row_maxima) if row_max == value]
+    columns = [c for c, column_min in enumerate(column_minima) if column_min == value]
+    return [{"row": r + 1, "column": c + 1} for r in rows for c in columns]
+
+
+def saddle_point_arrays(matrix):
+    """Find saddle points of a NumPy array or a `.npy` file path.
+
+    Files are memory-mapped, so only one row and column reduction is kept in
+    memory. Returns (rows, columns) arrays of 0-based indices, in row-major order.
+    """
+    import numpy as np
 
-    saddle_points_list = []
+    if isinstance(matrix, (str, bytes)) or hasattr(matrix, "__fspath__"):
+        matrix = np.load(matrix, mmap_mode="r")
+    matrix = np.asanyarray(matrix)
+    if matrix.ndim != 2:
+        raise ValueError("irregular matrix")
+    if matrix.size == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
 
-    for r in range(num_rows):
-        row_max = max(matrix[r])
-        for c in range(num_cols):
-            if matrix[r][c] == row_max:
-                # Check if it's the minimum in its column
-                column_values = [matrix[i][c] for i in range(num_rows)]
-                if matrix[r][c] == min(column_values):
-                    saddle_points_list.append({"row": r + 1, "column": c + 1})
+    row_maxima = matrix.max(axis=1)
+    column_minima = matrix.min(axis=0)
+    value = row_maxima.min()
+    if column_minima.max() != value:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
 
-    return saddle_points_list
\ No newline at end of file
+    rows = np.flatnonzero(row_maxima == value)
+    columns = np.flatnonzero(column_minima == value)
+    return np.repeat(rows, len(columns)), np.tile(columns, len(rows))
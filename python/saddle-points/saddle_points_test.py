@@ -2,9 +2,13 @@
 # https://github.com/exercism/problem-specifications/tree/main/exercises/saddle-points/canonical-data.json
 # File last updated on 2023-07-19
 
+import importlib.util
+import os
+import tempfile
 import unittest
 
 from saddle_points import (
+    saddle_point_arrays,
     saddle_points,
 )
 
@@ -95,3 +99,34 @@ class SaddlePointsTest(unittest.TestCase):
             saddle_points(matrix)
         self.assertEqual(type(err.exception), ValueError)
         self.assertEqual(err.exception.args[0], "irregular matrix")
+
+    def test_matrix_with_an_empty_row_has_no_saddle_points(self):
+        self.assertEqual(saddle_points([[]]), [])
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_saddle_point_arrays_match_saddle_points(self):
+        import numpy as np
+
+        matrix = [[4, 5, 4], [3, 5, 5], [1, 5, 4]]
+        rows, columns = saddle_point_arrays(np.array(matrix))
+        self.assertEqual(
+            [{"row": r + 1, "column": c + 1} for r, c in zip(rows, columns)],
+            saddle_points(matrix),
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_saddle_point_arrays_from_npy_file(self):
+        import numpy as np
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "matrix.npy")
+            np.save(path, np.array([[9, 8, 7], [5, 3, 2], [6, 6, 7]]))
+            rows, columns = saddle_point_arrays(path)
+        self.assertEqual((rows.tolist(), columns.tolist()), ([1], [0]))
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_saddle_point_arrays_without_saddle_points(self):
+        import numpy as np
+
+        rows, columns = saddle_point_arrays(np.array([[1, 2, 3], [3, 1, 2], [2, 3, 1]]))
+        self.assertEqual((rows.tolist(), columns.tolist()), ([], []))
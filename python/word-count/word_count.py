@@ -1,5 +1,26 @@
+import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+SHARD_SIZE = 1 << 26  # bytes of input per worker task
+
+
+def _words(text):
+    """
+    Yield the cleaned words of `text`, exactly as `count_words` sees them.
+    """
+    # Normalize unicode apostrophes to standard
+    text = text.lower().replace("’", "'")
+
+    # Use regex to find all sequences of letters, numbers, and apostrophes.
+    # This correctly separates words based on punctuation and whitespace,
+    # while keeping contractions like "that's" together.
+    for word in WORD_PATTERN.findall(text):
+        # Remove any leading or trailing apostrophes from each item.
+        yield word.strip("'")
+
 
 def count_words(sentence):
     """
@@ -9,16 +30,75 @@ def count_words(sentence):
     various forms of punctuation. It correctly ignores apostrophes used as
     quotation marks.
     """
-    # Normalize unicode apostrophes to standard
-    sentence = sentence.lower().replace("’", "'")
+    # Count the frequency of each unique, cleaned word.
+    return Counter(_words(sentence))
 
-    # Use regex to find all sequences of letters, numbers, and apostrophes.
-    # This correctly separates words based on punctuation and whitespace,
-    # while keeping contractions like "that's" together.
-    potential_words = re.findall(r"[a-z0-9']+", sentence)
 
-    # Remove any leading or trailing apostrophes from each item.
-    cleaned_words = [word.strip("'") for word in potential_words]
+def count_words_stream(lines):
+    """
+    Count words over an iterable of lines (e.g. an open file) incrementally.
 
-    # Count the frequency of each unique, cleaned word.
-    return Counter(cleaned_words)
+    Words never span a line break, so the result equals `count_words` on the
+    joined text while only one line is held in memory at a time.
+    """
+    counts = Counter()
+    for line in lines:
+        counts.update(_words(line))
+    return counts
+
+
+def _shards(paths, shard_size):
+    """
+    Split every file into (path, start, stop) byte ranges of about `shard_size`.
+    """
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), shard_size):
+            yield path, start, start + shard_size
+
+
+def _count_shard(path, start, stop):
+    """
+    Count the words of every line that begins inside [start, stop) of `path`.
+    """
+    counts = Counter()
+    with open(path, "rb") as corpus:
+        if start:
+            # Skip the line straddling `start`; the previous shard owns it.
+            corpus.seek(start - 1)
+            corpus.readline()
+        while corpus.tell() < stop:
+            line = corpus.readline()
+            if not line:
+                break
+            counts.update(_words(line.decode("utf-8")))
+    return counts
+
+
+def _merge(counters):
+    """
+    Merge partial counters pairwise, level by level (a tree reduction).
+    """
+    counters = list(counters) or [Counter()]
+    while len(counters) > 1:
+        merged = []
+        for index in range(0, len(counters) - 1, 2):
+            counters[index].update(counters[index + 1])
+            merged.append(counters[index])
+        if len(counters) % 2:
+            merged.append(counters[-1])
+        counters = merged
+    return counters[0]
+
+
+def count_words_files(paths, workers=None, shard_size=SHARD_SIZE):
+    """
+    Count words across UTF-8 text files using a pool of `workers` processes.
+
+    Each file is cut into line-aligned byte shards that are counted in
+    parallel, and the partial counts are merged with a tree reduction.
+    """
+    shards = list(_shards(paths, shard_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(_count_shard, *zip(*shards)) if shards else []
+        return _merge(partials)
@@ -2,10 +2,14 @@
 # https://github.com/exercism/problem-specifications/tree/main/exercises/word-count/canonical-data.json
 # File last updated on 2023-07-19
 
+import os
+import tempfile
 import unittest
 
 from word_count import (
     count_words,
+    count_words_files,
+    count_words_stream,
 )
 
 
@@ -123,3 +127,20 @@ class WordCountTest(unittest.TestCase):
 
     def test_multiple_apostrophes_ignored(self):
         self.assertEqual(count_words("''hey''"), {"hey": 1})
+
+    def test_stream_matches_count_words(self):
+        lines = ["Joe can't tell between 'large' and large.\n", "Go\u2019s fine, GO!\n"]
+        self.assertEqual(count_words_stream(lines), count_words("".join(lines)))
+
+    def test_files_match_count_words_across_shards(self):
+        text = "one fish two fish\nred fish blue fish\n\u2018quoted\u2019 don\u2019t\n" * 50
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name in ("a.txt", "b.txt"):
+                paths.append(os.path.join(directory, name))
+                with open(paths[-1], "w", encoding="utf-8") as corpus:
+                    corpus.write(text)
+            self.assertEqual(
+                count_words_files(paths, workers=2, shard_size=37),
+                count_words(text * 2),
+            )